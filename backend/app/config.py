@@ -42,15 +42,30 @@ class Settings(BaseSettings):
     postgres_user: str = "postgres"
     postgres_password: str = "postgres"
     postgres_db: str = "RubricDeepResearch"
+    db_max_connections: int = 100  # Server-side max_connections; pool_size + max_overflow per worker must fit in it
+    db_pool_size: int = 25  # Persistent connections kept per worker process
+    db_max_overflow: int = 25  # Extra connections opened under burst load
+    db_pool_recycle: int = 1800  # Seconds before a pooled connection is replaced
+    db_pool_pre_ping: bool = True  # Validate connections on checkout
+    pgbouncer_transaction_mode: bool = False  # Behind PgBouncer (transaction pooling) use NullPool
+    db_slow_query_ms: int = 500  # Statements slower than this are logged as warnings
     
     # Data Sync Settings
     sync_interval_hours: int = 1
     initial_sync_on_startup: bool = True
     
+    # Cache Settings
+    reference_cache_ttl_seconds: int = 300  # TTL for contributor map and allowed quality dimensions
+    aggregation_cache_ttl_seconds: int = 120  # TTL for cached dashboard aggregation results
+    
     # S3 Settings
     s3_bucket: str = "agi-ds-turing"
     s3_prefix: str = "Nova Deep Research - Turing Scale-Up/outputData/"
     s3_aws_profile: str = "amazon"  # AWS CLI profile name
+    s3_max_workers: int = 16  # Concurrent GetObject requests during ingestion
+    s3_ingest_batch_size: int = 1000  # Work items per upsert statement during ingestion
+    s3_db_pool_size: int = 2  # Persistent connections of the ingestion engine (writes from one thread)
+    s3_db_max_overflow: int = 2  # Extra ingestion connections
     
     # AWS Credentials
     aws_region: Optional[str] = None
@@ -132,9 +132,9 @@ async def startup_event():
                 'contributor',
                 'work_item'
             ]
-            logger.info("Current table row counts:")
+            logger.info("Current table row counts (estimated):")
             for table in tables:
-                count = db_service.get_table_row_count(table)
+                count = db_service.get_table_row_count(table, fast=True)
                 logger.info(f"  - {table}: {count:,} rows")
         else:
             logger.error("✗ Failed to initialize database")
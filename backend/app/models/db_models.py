@@ -4,7 +4,7 @@ Stores only the derived CTE results from _build_review_detail_query
 """
 from sqlalchemy import (
     Column, Integer, String, Float, DateTime, 
-    Text, BigInteger, Index
+    Text, BigInteger, Index, text
 )
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
@@ -48,6 +48,19 @@ class ReviewDetail(Base):
         Index('idx_reviewer_name', 'reviewer_id', 'name'),
         Index('idx_trainer_name', 'human_role_id', 'name'),
         Index('idx_conversation_name', 'conversation_id', 'name'),
+        # Covers the dashboard filter predicates so aggregations can use index-only scans
+        Index(
+            'idx_rd_predelivery',
+            'is_delivered', 'domain', 'reviewer_id', 'human_role_id', 'name',
+            postgresql_include=['score', 'conversation_id', 'task_score']
+        ),
+        # Delivered rows joined to task for the client-delivery aggregations
+        Index(
+            'idx_rd_delivered',
+            'conversation_id',
+            postgresql_include=['domain', 'name', 'score', 'task_score', 'human_role_id', 'reviewer_id'],
+            postgresql_where=text("is_delivered = 'True'")
+        ),
     )
 
 
@@ -96,6 +109,22 @@ class Task(Base):
     
     # Extracted domain (from CTE CASE statement)
     domain = Column(String(500), nullable=True, index=True)
+    
+    # Additional indexes for performance
+    __table_args__ = (
+        # Pre-delivery task counts and the review_detail -> task join
+        Index(
+            'idx_task_predelivery',
+            'is_delivered', 'domain', 'current_user_id',
+            postgresql_include=['id', 'rework_count', 'colab_link', 'week_number']
+        ),
+        # task -> work_item join on colab_link for delivered tasks
+        Index(
+            'idx_task_colab_link',
+            'colab_link', 'is_delivered',
+            postgresql_include=['id', 'domain', 'rework_count', 'current_user_id']
+        ),
+    )
 
 
 class Contributor(Base):
@@ -148,7 +177,7 @@ class WorkItem(Base):
     # Metadata
     ingestion_date = Column(String(100), nullable=True, index=True)  # Folder name (YYYY-MM-DD)
     delivery_date = Column(DateTime, nullable=True, index=True)  # File upload date from S3
-    json_filename = Column(String(500), nullable=True)
+    json_filename = Column(String(500), nullable=True, index=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     
     # Status fields
@@ -165,4 +194,10 @@ class WorkItem(Base):
         Index('idx_annotator_ingestion', 'annotator_id', 'ingestion_date'),
         Index('idx_delivery_date', 'delivery_date'),
         Index('idx_status', 'turing_status', 'client_status'),
+        # work_item side of the task join and the delivery tracker
+        Index(
+            'idx_workitem_colab_link',
+            'colab_link',
+            postgresql_include=['task_id', 'delivery_date', 'json_filename']
+        ),
     )
@@ -2,6 +2,7 @@
 API endpoints for aggregated statistics
 """
 from fastapi import APIRouter, HTTPException, Query, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
 from typing import List, Optional, Dict, Any
 import logging
 
@@ -12,7 +13,8 @@ from app.schemas.response_schemas import (
     OverallAggregation,
     TaskLevelInfo
 )
-from app.services.postgres_query_service import get_postgres_query_service
+from app.config import get_settings
+from app.services.postgres_query_service import get_postgres_query_service, AGGREGATION_SORT_KEYS
 from app.services.data_sync_service import get_data_sync_service
 from app.services.s3_ingestion_service import get_s3_ingestion_service
 from app.services.client_feedback_service import get_client_feedback_service
@@ -20,6 +22,11 @@ from app.services.client_feedback_service import get_client_feedback_service
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Statistics"])
 
+settings = get_settings()
+
+# sort_by values accepted by the grouped endpoints, e.g. "task_count" or "-average_task_score"
+SORT_BY_PATTERN = f"^-?({'|'.join(AGGREGATION_SORT_KEYS)})$"
+
 
 @router.get(
     "/by-domain",
@@ -34,7 +41,11 @@ async def get_stats_by_domain(
     quality_dimension: Optional[str] = Query(None, description="Filter by quality dimension name"),
     min_score: Optional[float] = Query(None, ge=0, le=5, description="Minimum score"),
     max_score: Optional[float] = Query(None, ge=0, le=5, description="Maximum score"),
-    min_task_count: Optional[int] = Query(None, ge=1, description="Minimum task count")
+    min_task_count: Optional[int] = Query(None, ge=1, description="Minimum task count"),
+    sort_by: Optional[str] = Query(None, pattern=SORT_BY_PATTERN, description="Sort groups by a statistic (prefix with '-' for descending); defaults to name"),
+    limit: Optional[int] = Query(None, ge=1, le=settings.max_page_size, description="Maximum number of groups to return"),
+    offset: int = Query(0, ge=0, description="Number of groups to skip"),
+    nocache: bool = Query(False, description="Bypass the aggregation cache")
 ) -> List[DomainAggregation]:
     """
     Get statistics aggregated by domain
@@ -60,7 +71,10 @@ async def get_stats_by_domain(
             'max_score': max_score,
             'min_task_count': min_task_count
         }
-        result = pg_service.get_domain_aggregation(filters)
+        result = await run_in_threadpool(
+            pg_service.get_domain_aggregation,
+            filters, use_cache=not nocache, sort_by=sort_by, limit=limit, offset=offset
+        )
         
         return [DomainAggregation(**item) for item in result]
     
@@ -84,7 +98,11 @@ async def get_stats_by_reviewer(
     quality_dimension: Optional[str] = Query(None, description="Filter by quality dimension name"),
     min_score: Optional[float] = Query(None, ge=0, le=5, description="Minimum score"),
     max_score: Optional[float] = Query(None, ge=0, le=5, description="Maximum score"),
-    min_task_count: Optional[int] = Query(None, ge=1, description="Minimum task count")
+    min_task_count: Optional[int] = Query(None, ge=1, description="Minimum task count"),
+    sort_by: Optional[str] = Query(None, pattern=SORT_BY_PATTERN, description="Sort groups by a statistic (prefix with '-' for descending); defaults to name"),
+    limit: Optional[int] = Query(None, ge=1, le=settings.max_page_size, description="Maximum number of groups to return"),
+    offset: int = Query(0, ge=0, description="Number of groups to skip"),
+    nocache: bool = Query(False, description="Bypass the aggregation cache")
 ) -> List[ReviewerAggregation]:
     """
     Get statistics aggregated by reviewer
@@ -110,7 +128,10 @@ async def get_stats_by_reviewer(
             'max_score': max_score,
             'min_task_count': min_task_count
         }
-        result = pg_service.get_reviewer_aggregation(filters)
+        result = await run_in_threadpool(
+            pg_service.get_reviewer_aggregation,
+            filters, use_cache=not nocache, sort_by=sort_by, limit=limit, offset=offset
+        )
         
         return [ReviewerAggregation(**item) for item in result]
     
@@ -134,7 +155,11 @@ async def get_stats_by_trainer_level(
     quality_dimension: Optional[str] = Query(None, description="Filter by quality dimension name"),
     min_score: Optional[float] = Query(None, ge=0, le=5, description="Minimum score"),
     max_score: Optional[float] = Query(None, ge=0, le=5, description="Maximum score"),
-    min_task_count: Optional[int] = Query(None, ge=1, description="Minimum task count")
+    min_task_count: Optional[int] = Query(None, ge=1, description="Minimum task count"),
+    sort_by: Optional[str] = Query(None, pattern=SORT_BY_PATTERN, description="Sort groups by a statistic (prefix with '-' for descending); defaults to name"),
+    limit: Optional[int] = Query(None, ge=1, le=settings.max_page_size, description="Maximum number of groups to return"),
+    offset: int = Query(0, ge=0, description="Number of groups to skip"),
+    nocache: bool = Query(False, description="Bypass the aggregation cache")
 ) -> List[TrainerLevelAggregation]:
     """
     Get statistics aggregated by trainer level
@@ -161,7 +186,10 @@ async def get_stats_by_trainer_level(
             'max_score': max_score,
             'min_task_count': min_task_count
         }
-        result = pg_service.get_trainer_aggregation(filters)
+        result = await run_in_threadpool(
+            pg_service.get_trainer_aggregation,
+            filters, use_cache=not nocache, sort_by=sort_by, limit=limit, offset=offset
+        )
         
         return [TrainerLevelAggregation(**item) for item in result]
     
@@ -185,7 +213,8 @@ async def get_overall_stats(
     quality_dimension: Optional[str] = Query(None, description="Filter by quality dimension name"),
     min_score: Optional[float] = Query(None, ge=0, le=5, description="Minimum score"),
     max_score: Optional[float] = Query(None, ge=0, le=5, description="Maximum score"),
-    min_task_count: Optional[int] = Query(None, ge=1, description="Minimum task count")
+    min_task_count: Optional[int] = Query(None, ge=1, description="Minimum task count"),
+    nocache: bool = Query(False, description="Bypass the aggregation cache")
 ) -> OverallAggregation:
     """
     Get overall aggregated statistics
@@ -211,7 +240,7 @@ async def get_overall_stats(
             'max_score': max_score,
             'min_task_count': min_task_count
         }
-        result = pg_service.get_overall_aggregation(filters)
+        result = await run_in_threadpool(pg_service.get_overall_aggregation, filters, use_cache=not nocache)
         
         return OverallAggregation(**result)
     
@@ -266,7 +295,7 @@ async def get_task_level_info(
             'date_from': date_from,
             'date_to': date_to
         }
-        result = pg_service.get_task_level_data(filters)
+        result = await run_in_threadpool(pg_service.get_task_level_data, filters)
         
         return [TaskLevelInfo(**item) for item in result]
     
@@ -401,7 +430,7 @@ async def get_client_delivery_overall_stats(
         if max_score is not None:
             filters['max_score'] = max_score
         
-        result = query_service.get_client_delivery_aggregation(filters if filters else None)
+        result = await run_in_threadpool(query_service.get_client_delivery_aggregation, filters if filters else None)
         return result
     except Exception as e:
         logger.error(f"Error retrieving client delivery overall statistics: {e}")
@@ -443,7 +472,7 @@ async def get_client_delivery_stats_by_domain(
         if max_score is not None:
             filters['max_score'] = max_score
         
-        result = query_service.get_client_delivery_domain_aggregation(filters if filters else None)
+        result = await run_in_threadpool(query_service.get_client_delivery_domain_aggregation, filters if filters else None)
         return result
     except Exception as e:
         logger.error(f"Error retrieving client delivery domain statistics: {e}")
@@ -485,7 +514,7 @@ async def get_client_delivery_stats_by_trainer(
         if max_score is not None:
             filters['max_score'] = max_score
         
-        result = query_service.get_client_delivery_trainer_aggregation(filters if filters else None)
+        result = await run_in_threadpool(query_service.get_client_delivery_trainer_aggregation, filters if filters else None)
         return result
     except Exception as e:
         logger.error(f"Error retrieving client delivery trainer statistics: {e}")
@@ -527,7 +556,7 @@ async def get_client_delivery_stats_by_reviewer(
         if max_score is not None:
             filters['max_score'] = max_score
         
-        result = query_service.get_client_delivery_reviewer_aggregation(filters if filters else None)
+        result = await run_in_threadpool(query_service.get_client_delivery_reviewer_aggregation, filters if filters else None)
         return result
     except Exception as e:
         logger.error(f"Error retrieving client delivery reviewer statistics: {e}")
@@ -0,0 +1,86 @@
+"""
+In-process TTL cache for dashboard aggregation results
+Entries are keyed on the method name, the non-empty filters and a generation
+counter that is bumped whenever the underlying tables are refreshed
+"""
+import copy
+import functools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on stored entries; filter combinations are user-controlled
+_MAX_ENTRIES = 1024
+
+_cache: Dict[Tuple, Tuple[float, Any]] = {}
+_generation = 0
+_lock = threading.Lock()
+
+
+def invalidate_aggregation_cache() -> None:
+    """Drop all cached aggregations (call after review_detail/task/work_item refresh)"""
+    global _generation
+    with _lock:
+        _generation += 1
+        _cache.clear()
+    logger.info("Aggregation cache invalidated")
+
+
+def _make_key(name: str, generation: int, filters: Optional[Dict[str, Any]],
+              options: Optional[Dict[str, Any]] = None) -> Tuple:
+    """Build a canonical cache key, ignoring unset filter and option values"""
+    items = tuple(sorted(
+        (key, value) for key, value in (filters or {}).items() if value is not None
+    ))
+    option_items = tuple(sorted(
+        (key, value) for key, value in (options or {}).items() if value is not None
+    ))
+    return (name, generation, items, option_items)
+
+
+def cached_aggregation(ttl: Optional[int] = None) -> Callable:
+    """
+    Cache the result of an aggregation method taking (self, filters, **options)
+    Keyword options (e.g. pagination) are part of the cache key.
+    The wrapped method accepts an extra keyword-only use_cache to bypass the cache;
+    options must be passed by keyword
+
+    Args:
+        ttl: Seconds to keep a result (defaults to settings.aggregation_cache_ttl_seconds)
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, filters: Optional[Dict[str, Any]] = None, *, use_cache: bool = True, **options):
+            if not use_cache:
+                return func(self, filters, **options)
+
+            generation = _generation
+            key = _make_key(func.__name__, generation, filters, options)
+            now = time.monotonic()
+
+            with _lock:
+                entry = _cache.get(key)
+            if entry is not None and entry[0] > now:
+                # Hand out a copy so callers can't mutate the cached value
+                return copy.deepcopy(entry[1])
+
+            result = func(self, filters, **options)
+
+            expires_at = now + (ttl if ttl is not None else get_settings().aggregation_cache_ttl_seconds)
+            with _lock:
+                # Skip storing if the cache was invalidated while we computed
+                if generation == _generation:
+                    if len(_cache) >= _MAX_ENTRIES:
+                        for stale_key in [k for k, (exp, _) in _cache.items() if exp <= now]:
+                            del _cache[stale_key]
+                        if len(_cache) >= _MAX_ENTRIES:
+                            _cache.clear()
+                    _cache[key] = (expires_at, copy.deepcopy(result))
+            return result
+        return wrapper
+    return decorator
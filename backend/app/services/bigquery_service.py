@@ -194,9 +194,11 @@ class BigQueryService:
         # Group results by the group_key
         grouped_data = defaultdict(lambda: defaultdict(lambda: {
             'name': None,
-            'conversation_ids': set(),
-            'scores': []
+            'score_sum': 0.0,
+            'score_count': 0
         }))
+        # Unique conversations per group, kept once per group rather than per dimension
+        group_conversation_ids = defaultdict(set)
         
         for row in results:
             # Determine group value
@@ -213,36 +215,31 @@ class BigQueryService:
                 grouped_data[group_value][name]['name'] = name
                 
                 if conversation_id is not None:
-                    grouped_data[group_value][name]['conversation_ids'].add(conversation_id)
+                    group_conversation_ids[group_value].add(conversation_id)
                 
                 if score is not None:
-                    grouped_data[group_value][name]['scores'].append(score)
+                    grouped_data[group_value][name]['score_sum'] += score
+                    grouped_data[group_value][name]['score_count'] += 1
         
         # Convert to final format
         result = []
         for group_value, dimensions in grouped_data.items():
             quality_dimensions = []
-            all_conversation_ids = set()  # Track all unique conversations for this group
             
             for name, data in dimensions.items():
-                avg_score = None
-                if data['scores']:
-                    avg_score = sum(data['scores']) / len(data['scores'])
-                
-                # Add conversation IDs to the group-level set
-                all_conversation_ids.update(data['conversation_ids'])
+                avg_score = data['score_sum'] / data['score_count'] if data['score_count'] else None
                 
                 quality_dimensions.append({
                     'name': data['name'],
                     'average_score': avg_score,
-                    'score_count': len(data['scores'])
+                    'score_count': data['score_count']
                 })
             
             # Sort by name for consistency
             quality_dimensions.sort(key=lambda x: x['name'])
             
             item = {
-                'conversation_count': len(all_conversation_ids),  # Total unique conversations for this group
+                'conversation_count': len(group_conversation_ids[group_value]),  # Total unique conversations for this group
                 'quality_dimensions': quality_dimensions
             }
             
@@ -253,6 +250,54 @@ class BigQueryService:
         
         return result
     
+    def _process_overall_aggregation(self, results: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Process BigQuery results into a single overall aggregation
+        Specialized version of _process_aggregation_results for group_key=None
+        
+        Args:
+            results: Raw results from BigQuery
+            
+        Returns:
+            Overall aggregation, or None if no row has a quality dimension name
+        """
+        dimensions = {}
+        conversation_ids = set()
+        
+        for row in results:
+            name = row.get('name')
+            if name:  # Only process rows with a quality dimension name
+                data = dimensions.get(name)
+                if data is None:
+                    data = dimensions[name] = {'score_sum': 0.0, 'score_count': 0}
+                
+                conversation_id = row.get('conversation_id')
+                if conversation_id is not None:
+                    conversation_ids.add(conversation_id)
+                
+                score = row.get('score')
+                if score is not None:
+                    data['score_sum'] += score
+                    data['score_count'] += 1
+        
+        if not dimensions:
+            return None
+        
+        # Sort by name for consistency
+        quality_dimensions = [
+            {
+                'name': name,
+                'average_score': data['score_sum'] / data['score_count'] if data['score_count'] else None,
+                'score_count': data['score_count']
+            }
+            for name, data in sorted(dimensions.items())
+        ]
+        
+        return {
+            'conversation_count': len(conversation_ids),
+            'quality_dimensions': quality_dimensions
+        }
+    
     def _process_reviewer_aggregation_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Process BigQuery results for reviewer aggregation with reviewer names
@@ -267,10 +312,11 @@ class BigQueryService:
         grouped_data = defaultdict(lambda: {
             'reviewer_id': None,
             'reviewer_name': None,
+            'conversation_ids': set(),  # Unique conversations across all dimensions
             'dimensions': defaultdict(lambda: {
                 'name': None,
-                'conversation_ids': set(),
-                'scores': []
+                'score_sum': 0.0,
+                'score_count': 0
             })
         })
         
@@ -291,29 +337,24 @@ class BigQueryService:
                 grouped_data[reviewer_id]['dimensions'][quality_dim_name]['name'] = quality_dim_name
                 
                 if conversation_id is not None:
-                    grouped_data[reviewer_id]['dimensions'][quality_dim_name]['conversation_ids'].add(conversation_id)
+                    grouped_data[reviewer_id]['conversation_ids'].add(conversation_id)
                 
                 if score is not None:
-                    grouped_data[reviewer_id]['dimensions'][quality_dim_name]['scores'].append(score)
+                    grouped_data[reviewer_id]['dimensions'][quality_dim_name]['score_sum'] += score
+                    grouped_data[reviewer_id]['dimensions'][quality_dim_name]['score_count'] += 1
         
         # Convert to final format
         result = []
         for reviewer_id, reviewer_data in grouped_data.items():
             quality_dimensions = []
-            all_conversation_ids = set()  # Track all unique conversations for this reviewer
             
             for name, data in reviewer_data['dimensions'].items():
-                avg_score = None
-                if data['scores']:
-                    avg_score = sum(data['scores']) / len(data['scores'])
-                
-                # Add conversation IDs to the reviewer-level set
-                all_conversation_ids.update(data['conversation_ids'])
+                avg_score = data['score_sum'] / data['score_count'] if data['score_count'] else None
                 
                 quality_dimensions.append({
                     'name': data['name'],
                     'average_score': avg_score,
-                    'score_count': len(data['scores'])
+                    'score_count': data['score_count']
                 })
             
             # Sort by name for consistency
@@ -322,7 +363,7 @@ class BigQueryService:
             result.append({
                 'reviewer_id': reviewer_data['reviewer_id'],
                 'reviewer_name': reviewer_data['reviewer_name'],
-                'conversation_count': len(all_conversation_ids),  # Total unique conversations for this reviewer
+                'conversation_count': len(reviewer_data['conversation_ids']),  # Total unique conversations for this reviewer
                 'quality_dimensions': quality_dimensions
             })
         
@@ -342,10 +383,11 @@ class BigQueryService:
         grouped_data = defaultdict(lambda: {
             'trainer_level_id': None,
             'trainer_name': None,
+            'conversation_ids': set(),  # Unique conversations across all dimensions
             'dimensions': defaultdict(lambda: {
                 'name': None,
-                'conversation_ids': set(),
-                'scores': []
+                'score_sum': 0.0,
+                'score_count': 0
             })
         })
         
@@ -366,29 +408,24 @@ class BigQueryService:
                 grouped_data[trainer_level_id]['dimensions'][quality_dim_name]['name'] = quality_dim_name
                 
                 if conversation_id is not None:
-                    grouped_data[trainer_level_id]['dimensions'][quality_dim_name]['conversation_ids'].add(conversation_id)
+                    grouped_data[trainer_level_id]['conversation_ids'].add(conversation_id)
                 
                 if score is not None:
-                    grouped_data[trainer_level_id]['dimensions'][quality_dim_name]['scores'].append(score)
+                    grouped_data[trainer_level_id]['dimensions'][quality_dim_name]['score_sum'] += score
+                    grouped_data[trainer_level_id]['dimensions'][quality_dim_name]['score_count'] += 1
         
         # Convert to final format
         result = []
         for trainer_level_id, trainer_data in grouped_data.items():
             quality_dimensions = []
-            all_conversation_ids = set()  # Track all unique conversations for this trainer level
             
             for name, data in trainer_data['dimensions'].items():
-                avg_score = None
-                if data['scores']:
-                    avg_score = sum(data['scores']) / len(data['scores'])
-                
-                # Add conversation IDs to the trainer-level set
-                all_conversation_ids.update(data['conversation_ids'])
+                avg_score = data['score_sum'] / data['score_count'] if data['score_count'] else None
                 
                 quality_dimensions.append({
                     'name': data['name'],
                     'average_score': avg_score,
-                    'score_count': len(data['scores'])
+                    'score_count': data['score_count']
                 })
             
             # Sort by name for consistency
@@ -397,7 +434,7 @@ class BigQueryService:
             result.append({
                 'trainer_level_id': trainer_data['trainer_level_id'],
                 'trainer_name': trainer_data['trainer_name'],
-                'conversation_count': len(all_conversation_ids),  # Total unique conversations for this trainer level
+                'conversation_count': len(trainer_data['conversation_ids']),  # Total unique conversations for this trainer level
                 'quality_dimensions': quality_dimensions
             })
         
@@ -534,63 +571,42 @@ class BigQueryService:
         Process BigQuery results for task-level information
         
         Args:
-            results: Raw results from BigQuery with task and annotator info
+            results: Raw results from BigQuery with task and annotator info,
+                ordered by task_id (ORDER BY rd.conversation_id)
             
         Returns:
-            List of task-level data with annotator names and quality dimensions
+            List of task-level data with annotator names and quality dimensions,
+            in task_id order
         """
-        from collections import defaultdict
-        
-        # Group results by task_id (conversation_id)
-        grouped_data = defaultdict(lambda: {
-            'task_id': None,
-            'annotator_id': None,
-            'annotator_name': None,
-            'reviewer_id': None,
-            'reviewer_name': None,
-            'quality_dimensions': []
-        })
+        # Rows arrive sorted by task_id, so a new task starts whenever the id changes
+        result = []
+        task_data = None
         
         for row in results:
             task_id = row.get('task_id')
-            annotator_id = row.get('annotator_id')
-            annotator_name = row.get('annotator_name')
-            reviewer_id = row.get('reviewer_id')
-            reviewer_name = row.get('reviewer_name')
-            dimension_name = row.get('dimension_name')
-            score_text = row.get('score_text')
-            score = row.get('score')
+            if task_id is None:
+                continue
             
-            if task_id is not None:
-                # Set task and annotator info (will be the same for all rows of this task)
-                grouped_data[task_id]['task_id'] = task_id
-                grouped_data[task_id]['annotator_id'] = annotator_id
-                grouped_data[task_id]['annotator_name'] = annotator_name
-                grouped_data[task_id]['reviewer_id'] = reviewer_id
-                grouped_data[task_id]['reviewer_name'] = reviewer_name
-                
-                # Add quality dimension
-                if dimension_name:
-                    grouped_data[task_id]['quality_dimensions'].append({
-                        'name': dimension_name,
-                        'score_text': score_text,
-                        'score': score
-                    })
-        
-        # Convert to list
-        result = []
-        for task_id, task_data in grouped_data.items():
-            result.append({
-                'task_id': task_data['task_id'],
-                'annotator_id': task_data['annotator_id'],
-                'annotator_name': task_data['annotator_name'],
-                'reviewer_id': task_data['reviewer_id'],
-                'reviewer_name': task_data['reviewer_name'],
-                'quality_dimensions': task_data['quality_dimensions']
-            })
-        
-        # Sort by task_id for consistency
-        result.sort(key=lambda x: x['task_id'] if x['task_id'] is not None else 0)
+            if task_data is None or task_data['task_id'] != task_id:
+                # Task and annotator info is the same for all rows of this task
+                task_data = {
+                    'task_id': task_id,
+                    'annotator_id': row.get('annotator_id'),
+                    'annotator_name': row.get('annotator_name'),
+                    'reviewer_id': row.get('reviewer_id'),
+                    'reviewer_name': row.get('reviewer_name'),
+                    'quality_dimensions': []
+                }
+                result.append(task_data)
+            
+            # Add quality dimension
+            dimension_name = row.get('dimension_name')
+            if dimension_name:
+                task_data['quality_dimensions'].append({
+                    'name': dimension_name,
+                    'score_text': row.get('score_text'),
+                    'score': row.get('score')
+                })
         
         return result
     
@@ -641,24 +657,13 @@ class BigQueryService:
         reviewer_count = results[0]['reviewer_count'] if results else 0
         trainer_count = results[0]['trainer_count'] if results else 0
         
-        # Process quality dimension data (remove count fields for processing)
-        clean_results = [
-            {
-                'name': row['name'],
-                'conversation_id': row['conversation_id'],
-                'score_text': row['score_text'],
-                'score': row['score']
-            }
-            for row in results
-        ]
-        
-        processed = self._process_aggregation_results(clean_results, None)
+        # Process quality dimension data (the count fields are ignored)
+        overall = self._process_overall_aggregation(results)
         
-        # Return the first (and only) item for overall stats
-        if processed:
-            processed[0]['reviewer_count'] = reviewer_count
-            processed[0]['trainer_count'] = trainer_count
-            return processed[0]
+        if overall is not None:
+            overall['reviewer_count'] = reviewer_count
+            overall['trainer_count'] = trainer_count
+            return overall
         
         return {
             'conversation_count': 0,
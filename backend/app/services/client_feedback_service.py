@@ -5,6 +5,7 @@ Updates work_item table with client status (verdict)
 import pandas as pd
 import logging
 from typing import Dict, Any, List
+from sqlalchemy.orm import load_only
 from io import BytesIO
 from app.services.db_service import get_db_service
 from app.models.db_models import WorkItem
@@ -168,8 +169,16 @@ class ClientFeedbackService:
                         task_level_feedback = str(row['task_level_feedback']) if pd.notna(row['task_level_feedback']) else None
                         error_categories = str(row['error_categories']) if pd.notna(row['error_categories']) else None
                         
-                        # Find work_item by work_item_id only
-                        work_item = session.query(WorkItem).filter(
+                        # Find work_item by work_item_id only, loading just the columns updated below
+                        work_item = session.query(WorkItem).options(
+                            load_only(
+                                WorkItem.work_item_id,
+                                WorkItem.client_status,
+                                WorkItem.turing_status,
+                                WorkItem.task_level_feedback,
+                                WorkItem.error_categories
+                            )
+                        ).filter(
                             WorkItem.work_item_id == work_item_id
                         ).first()
                         
@@ -5,11 +5,14 @@ Syncs only the derived review_detail data, not raw tables
 import logging
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from sqlalchemy import text, delete
+from sqlalchemy import text, delete, update
+from sqlalchemy.orm import Session
 from google.cloud import bigquery
 
 from app.config import get_settings
 from app.services.db_service import get_db_service
+from app.services.aggregation_cache import invalidate_aggregation_cache
+from app.services.postgres_query_service import get_postgres_query_service
 from app.models.db_models import ReviewDetail, Task, Contributor, DataSyncLog, TaskReviewedInfo
 
 logger = logging.getLogger(__name__)
@@ -104,16 +107,15 @@ class DataSyncService:
         """Log the completion of a sync operation"""
         try:
             with self.db_service.get_session() as session:
-                log_entry = session.query(DataSyncLog).filter(
-                    DataSyncLog.id == log_id
-                ).first()
-                
-                if log_entry:
-                    log_entry.sync_completed_at = datetime.utcnow()
-                    log_entry.records_synced = records_synced
-                    log_entry.sync_status = 'completed' if success else 'failed'
-                    log_entry.error_message = error_message
-                    session.commit()
+                session.execute(
+                    update(DataSyncLog).where(DataSyncLog.id == log_id).values(
+                        sync_completed_at=datetime.utcnow(),
+                        records_synced=records_synced,
+                        sync_status='completed' if success else 'failed',
+                        error_message=error_message
+                    )
+                )
+                session.commit()
         except Exception as e:
             logger.error(f"Error logging sync complete: {e}")
     
@@ -429,6 +431,9 @@ class DataSyncService:
                 session.bulk_save_objects(objects)
                 session.commit()
             
+            # Cached contributor names would otherwise stay stale until their TTL expires
+            get_postgres_query_service().refresh_contributor_cache()
+            
             self.log_sync_complete(log_id, len(data), True)
             logger.info(f"✓ Successfully synced {len(data)} contributor records")
             return True
@@ -531,64 +536,82 @@ class DataSyncService:
             logger.error(f"✗ Error syncing task_reviewed_info: {e}")
             return False
     
-    def _update_is_delivered_status(self) -> None:
+    def _update_is_delivered_status(self, session: Optional[Session] = None) -> None:
         """
         Update is_delivered status for all tasks based on work_item table.
         Tasks that exist in work_item table will have is_delivered = 'True',
         all others will have is_delivered = 'False'.
         Also syncs the status to ReviewDetail table.
+        Args:
+            session: Optional open session; the updates then run in its transaction,
+                which is committed here together with the caller's pending writes
         """
         try:
             logger.info("Updating is_delivered status based on work_item table...")
             
-            with self.db_service.get_session() as session:
-                from app.models.db_models import WorkItem, ReviewDetail
-                from sqlalchemy import update
-                
-                # Get all unique task_ids from work_item table
-                delivered_colab_link_ids = session.query(WorkItem.colab_link).distinct().all()
-                delivered_colab_link_ids = [row[0] for row in delivered_colab_link_ids if row[0]]
-                
-                # Update Task table
-                # First, set all tasks to is_delivered = 'False'
-                session.execute(
-                    update(Task).values(is_delivered='False')
-                )
-                
-                # Then, set tasks that exist in work_item to is_delivered = 'True'
-                delivered_task_ids = []
-                if delivered_colab_link_ids:
-                    session.execute(
-                        update(Task).where(Task.colab_link.in_(delivered_colab_link_ids)).values(is_delivered='True')
-                    )
-                    
-                    # Get the actual task IDs for delivered tasks
-                    delivered_task_ids = session.query(Task.id).filter(
-                        Task.colab_link.in_(delivered_colab_link_ids)
-                    ).all()
-                    delivered_task_ids = [row[0] for row in delivered_task_ids]
-                
-                # Update ReviewDetail table to match Task table
-                # First, set all review_detail records to is_delivered = 'False'
-                session.execute(
-                    update(ReviewDetail).values(is_delivered='False')
-                )
-                
-                # Then, set review_detail records for delivered tasks to is_delivered = 'True'
-                if delivered_task_ids:
-                    session.execute(
-                        update(ReviewDetail).where(
-                            ReviewDetail.conversation_id.in_(delivered_task_ids)
-                        ).values(is_delivered='True')
-                    )
-                
-                session.commit()
-                logger.info(f"✓ Updated is_delivered status: {len(delivered_colab_link_ids)} colab_links ({len(delivered_task_ids)} tasks) marked as delivered")
+            if session is None:
+                with self.db_service.get_session() as own_session:
+                    self._apply_is_delivered_status(own_session)
+            else:
+                self._apply_is_delivered_status(session)
+            
+            # Pre-aggregated dashboard statistics depend on is_delivered
+            if not get_postgres_query_service().refresh_review_aggregates():
+                logger.warning("Aggregate views could not be refreshed, dashboards use live queries until the next sync")
+            invalidate_aggregation_cache()
                 
         except Exception as e:
             logger.error(f"Error updating is_delivered status: {e}")
             raise
     
+    def _apply_is_delivered_status(self, session: Session) -> None:
+        """
+        Run the is_delivered updates for Task and ReviewDetail in session and commit
+        Args:
+            session: Open database session
+        """
+        from app.models.db_models import WorkItem, ReviewDetail
+        
+        # Get all unique task_ids from work_item table
+        delivered_colab_link_ids = session.query(WorkItem.colab_link).distinct().all()
+        delivered_colab_link_ids = [row[0] for row in delivered_colab_link_ids if row[0]]
+        
+        # Update Task table
+        # First, set all tasks to is_delivered = 'False'
+        session.execute(
+            update(Task).values(is_delivered='False')
+        )
+        
+        # Then, set tasks that exist in work_item to is_delivered = 'True'
+        delivered_task_ids = []
+        if delivered_colab_link_ids:
+            session.execute(
+                update(Task).where(Task.colab_link.in_(delivered_colab_link_ids)).values(is_delivered='True')
+            )
+            
+            # Get the actual task IDs for delivered tasks
+            delivered_task_ids = session.query(Task.id).filter(
+                Task.colab_link.in_(delivered_colab_link_ids)
+            ).all()
+            delivered_task_ids = [row[0] for row in delivered_task_ids]
+        
+        # Update ReviewDetail table to match Task table
+        # First, set all review_detail records to is_delivered = 'False'
+        session.execute(
+            update(ReviewDetail).values(is_delivered='False')
+        )
+        
+        # Then, set review_detail records for delivered tasks to is_delivered = 'True'
+        if delivered_task_ids:
+            session.execute(
+                update(ReviewDetail).where(
+                    ReviewDetail.conversation_id.in_(delivered_task_ids)
+                ).values(is_delivered='True')
+            )
+        
+        session.commit()
+        logger.info(f"✓ Updated is_delivered status: {len(delivered_colab_link_ids)} colab_links ({len(delivered_task_ids)} tasks) marked as delivered")
+    
     def sync_all_tables(self, sync_type: str = 'scheduled') -> Dict[str, bool]:
         """Sync all required data from BigQuery to PostgreSQL"""
         logger.info(f"Starting data sync ({sync_type})...")
@@ -620,6 +643,9 @@ class DataSyncService:
         except Exception as e:
             logger.error(f"Error updating is_delivered status: {e}")
         
+        # Cached dashboard aggregations are stale once any table was rewritten
+        invalidate_aggregation_cache()
+        
         success_count = sum(1 for v in results.values() if v)
         logger.info("=" * 80)
         logger.info(f"Data sync completed: {success_count}/{len(results)} tables synced successfully")
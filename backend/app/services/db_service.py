@@ -2,19 +2,45 @@
 PostgreSQL database connection and management service
 """
 import logging
-from sqlalchemy import create_engine, text, inspect
+import re
+import threading
+import time
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import URL, Connection
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.pool import NullPool
 from sqlalchemy.exc import OperationalError, ProgrammingError
 from contextlib import contextmanager
-from typing import Generator
+from contextvars import ContextVar
+from typing import Any, Dict, Generator, Optional
 import psycopg2
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from psycopg2 import sql
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT, connection as PGConnection
 
 from app.config import get_settings
 from app.models.db_models import Base
 
 logger = logging.getLogger(__name__)
 
+# COUNT(*) statements for every known table, built once at import. Restricting
+# get_table_row_count to these keeps table names out of ad-hoc SQL and gives the
+# same statement text (and compiled-cache entry) on every call.
+_COUNT_SQL = {
+    table_name: text(f'SELECT COUNT(*) FROM "{table_name}"')
+    for table_name in Base.metadata.tables
+}
+_ESTIMATED_COUNT_SQL = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:t)"
+)
+# Indexes in the current schema and whether they are usable (a failed or
+# interrupted CREATE INDEX CONCURRENTLY leaves an invalid index behind)
+_INDEX_STATUS_SQL = text(
+    "SELECT c.relname AS name, i.indisvalid AS valid "
+    "FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+    "WHERE c.relnamespace = current_schema()::regnamespace"
+)
+
 
 class DatabaseService:
     """Service for managing PostgreSQL database connections and operations"""
@@ -24,75 +50,81 @@ class DatabaseService:
         self.engine = None
         self.SessionLocal = None
         self._initialized = False
+        # Long-lived autocommit connection for cheap read-only lookups
+        self._ro_conn: Optional[Connection] = None
+        self._ro_conn_lock = threading.Lock()
+        # Build both connection URLs once; URL.create keeps the credentials as
+        # separate fields, so special characters in the password need no escaping
+        self._url_with_db = self._build_connection_url(self.settings.postgres_db)
+        self._url_admin = self._build_connection_url('postgres')
     
-    def get_connection_url(self, with_db: bool = True) -> str:
-        """Generate PostgreSQL connection URL"""
-        if with_db:
-            return (
-                f"postgresql://{self.settings.postgres_user}:"
-                f"{self.settings.postgres_password}@"
-                f"{self.settings.postgres_host}:"
-                f"{self.settings.postgres_port}/"
-                f"{self.settings.postgres_db}"
-            )
-        else:
-            return (
-                f"postgresql://{self.settings.postgres_user}:"
-                f"{self.settings.postgres_password}@"
-                f"{self.settings.postgres_host}:"
-                f"{self.settings.postgres_port}/"
-                "postgres"
-            )
+    def _build_connection_url(self, database: str) -> URL:
+        """Build a PostgreSQL connection URL for the given database"""
+        return URL.create(
+            "postgresql",
+            username=self.settings.postgres_user,
+            password=self.settings.postgres_password,
+            host=self.settings.postgres_host,
+            port=self.settings.postgres_port,
+            database=database
+        )
     
-    def check_database_exists(self) -> bool:
-        """Check if the database exists"""
+    def get_connection_url(self, with_db: bool = True) -> URL:
+        """Get the PostgreSQL connection URL"""
+        return self._url_with_db if with_db else self._url_admin
+    
+    @contextmanager
+    def _admin_conn(
+        self, conn: Optional[PGConnection] = None
+    ) -> Generator[PGConnection, None, None]:
+        """
+        Yield an autocommit connection to the 'postgres' maintenance database.
+        If an existing connection is passed in it is reused and left open.
+        """
+        if conn is not None:
+            yield conn
+            return
+        
+        conn = psycopg2.connect(
+            host=self.settings.postgres_host,
+            port=self.settings.postgres_port,
+            user=self.settings.postgres_user,
+            password=self.settings.postgres_password,
+            database='postgres'
+        )
         try:
-            conn = psycopg2.connect(
-                host=self.settings.postgres_host,
-                port=self.settings.postgres_port,
-                user=self.settings.postgres_user,
-                password=self.settings.postgres_password,
-                database='postgres'
-            )
             conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-            cursor = conn.cursor()
-            
-            cursor.execute(
-                "SELECT 1 FROM pg_database WHERE datname = %s",
-                (self.settings.postgres_db,)
-            )
-            exists = cursor.fetchone() is not None
-            
-            cursor.close()
+            yield conn
+        finally:
             conn.close()
-            
-            return exists
+    
+    def check_database_exists(self, conn: Optional[PGConnection] = None) -> bool:
+        """Check if the database exists"""
+        try:
+            with self._admin_conn(conn) as admin_conn:
+                with admin_conn.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT 1 FROM pg_database WHERE datname = %s",
+                        (self.settings.postgres_db,)
+                    )
+                    return cursor.fetchone() is not None
         except Exception as e:
             logger.error(f"Error checking database existence: {e}")
             return False
     
-    def create_database(self) -> bool:
+    def create_database(self, conn: Optional[PGConnection] = None) -> bool:
         """Create the database if it doesn't exist"""
         try:
             logger.info(f"Creating database: {self.settings.postgres_db}")
             
-            conn = psycopg2.connect(
-                host=self.settings.postgres_host,
-                port=self.settings.postgres_port,
-                user=self.settings.postgres_user,
-                password=self.settings.postgres_password,
-                database='postgres'
-            )
-            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-            cursor = conn.cursor()
-            
-            # Create database
-            cursor.execute(
-                f'CREATE DATABASE "{self.settings.postgres_db}"'
-            )
-            
-            cursor.close()
-            conn.close()
+            with self._admin_conn(conn) as admin_conn:
+                with admin_conn.cursor() as cursor:
+                    # Create database (identifier composed safely by psycopg2)
+                    cursor.execute(
+                        sql.SQL("CREATE DATABASE {}").format(
+                            sql.Identifier(self.settings.postgres_db)
+                        )
+                    )
             
             logger.info(f"Database {self.settings.postgres_db} created successfully")
             return True
@@ -106,11 +138,16 @@ class DatabaseService:
             connection_url = self.get_connection_url(with_db=True)
             self.engine = create_engine(
                 connection_url,
-                pool_size=10,
-                max_overflow=20,
-                pool_pre_ping=True,
+                **self._pool_options(),
+                connect_args={
+                    "keepalives": 1,
+                    "keepalives_idle": 30,
+                    "keepalives_interval": 10,
+                    "keepalives_count": 5,
+                },
                 echo=False
             )
+            self._register_query_timing()
             self.SessionLocal = sessionmaker(
                 autocommit=False,
                 autoflush=False,
@@ -128,15 +165,74 @@ class DatabaseService:
             logger.error(f"Error initializing database engine: {e}")
             return False
     
+    def _pool_options(self) -> Dict[str, Any]:
+        """
+        Build connection pool arguments for create_engine from settings
+        
+        Returns:
+            Keyword arguments for the pool configuration
+        """
+        if self.settings.pgbouncer_transaction_mode:
+            # PgBouncer owns the server connections; holding our own pool on top
+            # of transaction pooling would pin server connections to idle clients
+            logger.info("PgBouncer transaction mode enabled, using NullPool")
+            return {"poolclass": NullPool}
+        
+        pool_size = self.settings.db_pool_size
+        max_overflow = self.settings.db_max_overflow
+        # The S3 ingestion engine keeps its own pool in the same process
+        s3_connections = self.settings.s3_db_pool_size + self.settings.s3_db_max_overflow
+        if pool_size + max_overflow + s3_connections > self.settings.db_max_connections:
+            logger.warning(
+                f"Pool size {pool_size} + overflow {max_overflow} + ingestion pool {s3_connections} "
+                f"exceeds db_max_connections={self.settings.db_max_connections}"
+            )
+        return {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_recycle": self.settings.db_pool_recycle,
+            "pool_pre_ping": self.settings.db_pool_pre_ping,
+        }
+    
+    def _register_query_timing(self) -> None:
+        """
+        Time every statement executed on the engine.
+        Statements above settings.db_slow_query_ms are logged as warnings,
+        all others at DEBUG level.
+        """
+        slow_query_ms = self.settings.db_slow_query_ms
+        
+        @event.listens_for(self.engine, "before_cursor_execute")
+        def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if context is not None:
+                context._query_start_ns = time.perf_counter_ns()
+        
+        @event.listens_for(self.engine, "after_cursor_execute")
+        def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            start_ns = getattr(context, '_query_start_ns', None)
+            if start_ns is None:
+                return
+            
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            if elapsed_ms >= slow_query_ms:
+                level = logging.WARNING
+            elif logger.isEnabledFor(logging.DEBUG):
+                level = logging.DEBUG
+            else:
+                return
+            
+            compact_statement = ' '.join(statement.split())[:500]
+            logger.log(
+                level,
+                f"SQL {elapsed_ms:.1f} ms, rows={cursor.rowcount}: {compact_statement}"
+            )
+    
     def check_tables_exist(self) -> dict:
         """Check which tables exist in the database"""
         if not self._initialized or not self.engine:
             return {}
         
         try:
-            inspector = inspect(self.engine)
-            existing_tables = inspector.get_table_names()
-            
             required_tables = [
                 'task',
                 'review_detail',
@@ -145,6 +241,18 @@ class DatabaseService:
                 'work_item'  # S3 work items table
             ]
             
+            # Single catalog lookup instead of building a full Inspector
+            with self.engine.connect() as conn:
+                result = conn.execute(
+                    text(
+                        "SELECT relname FROM pg_class "
+                        "WHERE relkind = 'r' AND relname = ANY(:names) "
+                        "AND pg_table_is_visible(oid)"
+                    ),
+                    {"names": required_tables}
+                )
+                existing_tables = {row[0] for row in result}
+            
             table_status = {}
             for table in required_tables:
                 table_status[table] = table in existing_tables
@@ -162,13 +270,72 @@ class DatabaseService:
         
         try:
             logger.info("Creating database tables...")
-            Base.metadata.create_all(bind=self.engine)
+            # Run all CREATE TABLE/INDEX statements in one transaction so a
+            # failure leaves no partially created schema behind
+            with self.engine.begin() as conn:
+                Base.metadata.create_all(bind=conn, checkfirst=True)
             logger.info("All tables created successfully")
             return True
         except Exception as e:
             logger.error(f"Error creating tables: {e}")
             return False
     
+    def ensure_indexes(self) -> bool:
+        """
+        Create model indexes that are missing from existing tables.
+        create_all only builds indexes together with a new table, so indexes
+        added to the models later are created here with CREATE INDEX CONCURRENTLY
+        to avoid blocking writes on populated tables. An index left INVALID by an
+        interrupted concurrent build is dropped and built again.
+        
+        Returns:
+            True if every model index exists and is valid
+        """
+        if not self._initialized or not self.engine:
+            logger.error("Database engine not initialized")
+            return False
+        
+        ok = True
+        try:
+            # CONCURRENTLY cannot run inside a transaction block
+            with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                index_valid = {
+                    row.name: row.valid for row in conn.execute(_INDEX_STATUS_SQL)
+                }
+                for table in Base.metadata.sorted_tables:
+                    for index in sorted(table.indexes, key=lambda i: i.name):
+                        valid = index_valid.get(index.name)
+                        if valid:
+                            continue
+                        try:
+                            if valid is False:
+                                logger.warning(f"Index {index.name} is invalid, rebuilding...")
+                                conn.exec_driver_sql(f'DROP INDEX CONCURRENTLY IF EXISTS "{index.name}"')
+                            ddl = str(CreateIndex(index).compile(dialect=conn.dialect))
+                            ddl = re.sub(r"^CREATE (UNIQUE )?INDEX", r"CREATE \1INDEX CONCURRENTLY", ddl)
+                            logger.info(f"Creating index {index.name} on {table.name}...")
+                            conn.exec_driver_sql(ddl)
+                        except Exception as e:
+                            logger.error(f"Error creating index {index.name}: {e}")
+                            ok = False
+            return ok
+        except Exception as e:
+            logger.error(f"Error creating indexes: {e}")
+            return False
+    
+    def start_index_build(self) -> threading.Thread:
+        """
+        Run ensure_indexes() in a background thread so a long concurrent
+        index build does not hold up application startup
+        """
+        def build():
+            if not self.ensure_indexes():
+                logger.warning("Some indexes could not be created, continuing without them")
+        
+        thread = threading.Thread(target=build, name="db-index-build", daemon=True)
+        thread.start()
+        return thread
+    
     def drop_all_tables(self) -> bool:
         """Drop all tables (use with caution!)"""
         if not self._initialized or not self.engine:
@@ -209,20 +376,23 @@ class DatabaseService:
         3. Initialize engine
         4. Check tables
         5. Create tables if needed
+        6. Start creating missing indexes in the background
         """
         try:
             logger.info("Starting database initialization...")
             
-            # Step 1: Check if database exists
-            db_exists = self.check_database_exists()
-            logger.info(f"Database exists: {db_exists}")
-            
-            # Step 2: Create database if needed
-            if not db_exists:
-                logger.info("Database does not exist, creating...")
-                if not self.create_database():
-                    logger.error("Failed to create database")
-                    return False
+            # Steps 1-2 share one connection to the maintenance database
+            with self._admin_conn() as admin_conn:
+                # Step 1: Check if database exists
+                db_exists = self.check_database_exists(admin_conn)
+                logger.info(f"Database exists: {db_exists}")
+                
+                # Step 2: Create database if needed
+                if not db_exists:
+                    logger.info("Database does not exist, creating...")
+                    if not self.create_database(admin_conn):
+                        logger.error("Failed to create database")
+                        return False
             
             # Step 3: Initialize engine
             if not self.initialize_engine():
@@ -240,43 +410,117 @@ class DatabaseService:
                     logger.error("Failed to create tables")
                     return False
             
+            # Step 6: Add indexes introduced after the tables were created, in the
+            # background; queries work without them, only slower
+            self.start_index_build()
+            
             logger.info("Database initialization completed successfully")
             return True
         except Exception as e:
             logger.error(f"Error during database initialization: {e}")
             return False
     
-    def get_table_row_count(self, table_name: str) -> int:
-        """Get the number of rows in a table"""
+    @property
+    def _read_only_conn(self) -> Connection:
+        """
+        Lazily open the shared autocommit connection.
+        Callers must hold self._ro_conn_lock while using it.
+        """
+        if self._ro_conn is None or self._ro_conn.closed:
+            self._ro_conn = self.engine.connect().execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+        return self._ro_conn
+    
+    def _reset_read_only_conn(self) -> None:
+        """Discard the shared read-only connection so the next use reconnects"""
+        if self._ro_conn is not None:
+            try:
+                self._ro_conn.close()
+            except Exception:
+                pass
+            self._ro_conn = None
+    
+    def get_table_row_count(self, table_name: str, fast: bool = False) -> int:
+        """
+        Get the number of rows in a table
+        
+        Args:
+            table_name: Name of the table
+            fast: If True, return the planner estimate from pg_class.reltuples
+                  (O(1), dashboard-grade accuracy) instead of an exact COUNT(*).
+                  Falls back to COUNT(*) when the table has never been analyzed.
+        
+        Raises:
+            ValueError: If table_name is not a table defined in the models
+        """
+        count_stmt = _COUNT_SQL.get(table_name)
+        if count_stmt is None:
+            raise ValueError(f"Unknown table: {table_name}")
+        
         if not self._initialized or not self.engine:
             return 0
         
         try:
-            with self.engine.connect() as conn:
-                result = conn.execute(
-                    text(f'SELECT COUNT(*) FROM "{table_name}"')
-                )
-                count = result.scalar()
-                return count or 0
+            with self._ro_conn_lock:
+                try:
+                    count = None
+                    if fast:
+                        count = self._read_only_conn.execute(
+                            _ESTIMATED_COUNT_SQL, {"t": table_name}
+                        ).scalar()
+                        # reltuples is -1 (or NULL for a missing table) until ANALYZE runs
+                        if count is not None and count < 0:
+                            count = None
+                    if count is None:
+                        count = self._read_only_conn.execute(count_stmt).scalar()
+                except Exception:
+                    self._reset_read_only_conn()
+                    raise
+            return count or 0
         except Exception as e:
             logger.error(f"Error getting row count for {table_name}: {e}")
             return 0
     
     def close(self):
         """Close database connections"""
+        with self._ro_conn_lock:
+            self._reset_read_only_conn()
         if self.engine:
             self.engine.dispose()
             logger.info("Database connections closed")
 
 
 # Global database service instance
-_db_service = None
+_db_service: Optional[DatabaseService] = None
+_db_service_lock = threading.Lock()
+
+# Per-context override (e.g. for tests); takes precedence over the global instance
+_db_service_override: ContextVar[Optional[DatabaseService]] = ContextVar(
+    "db_service_override", default=None
+)
 
 
 def get_db_service() -> DatabaseService:
     """Get or create the global database service instance"""
+    override = _db_service_override.get()
+    if override is not None:
+        return override
+    
     global _db_service
     if _db_service is None:
-        _db_service = DatabaseService()
+        # Double-checked locking so concurrent first calls build only one engine/pool
+        with _db_service_lock:
+            if _db_service is None:
+                _db_service = DatabaseService()
     return _db_service
 
+
+@contextmanager
+def override_db_service(service: DatabaseService) -> Generator[DatabaseService, None, None]:
+    """Use a different database service for get_db_service() within the current context"""
+    token = _db_service_override.set(service)
+    try:
+        yield service
+    finally:
+        _db_service_override.reset(token)
@@ -2,18 +2,244 @@
 PostgreSQL query service for dashboard statistics
 Queries the materialized review_detail table
 """
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional, Set
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Set, Tuple
 from collections import defaultdict
-from sqlalchemy import func
+from sqlalchemy import Numeric, any_, bindparam, case, cast, column, func, or_, select, table, text, true, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.sql import Select
 from google.cloud import bigquery
 
 from app.config import get_settings
 from app.services.db_service import get_db_service
+from app.services.aggregation_cache import cached_aggregation
 from app.models.db_models import ReviewDetail, Contributor, Task, WorkItem
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip when streaming large result sets
+STREAM_BATCH_SIZE = 10000
+
+# Part of the aggregate views' allowed_key; bump it when a view definition changes
+# so existing views are rebuilt (and ignored by readers until then) instead of refreshed
+_AGGREGATE_VIEW_VERSION = 4
+
+# Pre-aggregated, unfiltered pre-delivery statistics for every grouping used by
+# the dashboard. Dimension rows (name set) and group rows (name NULL) are computed
+# with GROUPING SETS. The allowed quality dimensions come from BigQuery, so they
+# are bound when the view is built (psycopg2 interpolates parameters client-side,
+# which DDL requires) and fingerprinted in allowed_key.
+_REVIEW_AGG_VIEW = "mv_review_agg"
+_REVIEW_AGG_GRAIN = """
+    CASE
+        WHEN GROUPING(domain) = 0 THEN 'domain'
+        WHEN GROUPING(reviewer_id) = 0 THEN 'reviewer_id'
+        WHEN GROUPING(human_role_id) = 0 THEN 'human_role_id'
+        ELSE 'overall'
+    END"""
+_REVIEW_AGG_VIEW_SQL = """
+CREATE MATERIALIZED VIEW mv_review_agg AS
+WITH base AS (
+    SELECT domain, reviewer_id, human_role_id, name, score, conversation_id, task_score
+    FROM review_detail
+    WHERE is_delivered = 'False' AND name = ANY(:allowed_names)
+),
+dimension_stats AS (
+    SELECT {grain} AS grain,
+        domain, reviewer_id, human_role_id, name,
+        avg(score) AS average_score,
+        count(DISTINCT conversation_id) AS task_count
+    FROM base
+    GROUP BY GROUPING SETS ((name), (domain, name), (reviewer_id, name), (human_role_id, name))
+),
+per_task AS (
+    SELECT {grain} AS grain,
+        domain, reviewer_id, human_role_id, conversation_id,
+        max(task_score) AS task_score
+    FROM base
+    GROUP BY GROUPING SETS (
+        (conversation_id), (domain, conversation_id),
+        (reviewer_id, conversation_id), (human_role_id, conversation_id)
+    )
+),
+group_stats AS (
+    SELECT p.grain, p.domain, p.reviewer_id, p.human_role_id,
+        count(p.conversation_id) AS task_count,
+        avg(p.task_score) FILTER (WHERE p.conversation_id IS NOT NULL) AS average_task_score,
+        sum(t.rework_count) AS total_rework_count,
+        avg(t.rework_count) AS average_rework_count
+    FROM per_task p
+    LEFT JOIN task t ON t.id = p.conversation_id
+    GROUP BY p.grain, p.domain, p.reviewer_id, p.human_role_id
+),
+agg_rows AS (
+    SELECT grain, domain, reviewer_id, human_role_id, name,
+        average_score, task_count,
+        NULL::float AS average_task_score, NULL::bigint AS total_rework_count, NULL::numeric AS average_rework_count
+    FROM dimension_stats
+    UNION ALL
+    SELECT grain, domain, reviewer_id, human_role_id, NULL AS name,
+        NULL AS average_score, task_count,
+        average_task_score, total_rework_count, average_rework_count
+    FROM group_stats
+)
+SELECT *,
+    {row_key} AS row_key,
+    CAST(:allowed_key AS text) AS allowed_key
+FROM agg_rows
+"""
+# Non-null key of an aggregate view row. The grouping columns are NULL in most
+# rows, and a unique index over them would treat every such row as distinct;
+# quote_nullable keeps NULL and '' (or -1) apart
+_AGG_ROW_KEY = (
+    "concat_ws('|', grain, quote_nullable(domain), quote_nullable(reviewer_id), "
+    "quote_nullable(human_role_id), quote_nullable(name))"
+)
+# Needed for REFRESH MATERIALIZED VIEW CONCURRENTLY, which requires a unique
+# index on non-null columns
+_REVIEW_AGG_INDEX_SQL = (
+    "CREATE UNIQUE INDEX idx_mv_review_agg_key "
+    "ON mv_review_agg (row_key)"
+)
+
+# Pre-aggregated, unfiltered client-delivery statistics for the domain, trainer and
+# reviewer groupings, matching _query_client_delivery_stats. Built and fingerprinted
+# the same way as mv_review_agg; contributor names are joined when it is read
+_CLIENT_DELIVERY_AGG_VIEW = "mv_client_delivery_agg"
+_CLIENT_DELIVERY_AGG_GRAIN = """
+    CASE
+        WHEN GROUPING(domain) = 0 THEN 'domain'
+        WHEN GROUPING(human_role_id) = 0 THEN 'human_role_id'
+        ELSE 'reviewer_id'
+    END"""
+_CLIENT_DELIVERY_AGG_VIEW_SQL = """
+CREATE MATERIALIZED VIEW mv_client_delivery_agg AS
+WITH base AS (
+    SELECT rd.domain, rd.human_role_id, rd.reviewer_id, rd.name, rd.score, rd.task_score,
+        wi.task_id, t.rework_count
+    FROM review_detail rd
+    JOIN task t ON rd.conversation_id = t.id
+    JOIN work_item wi ON t.colab_link = wi.colab_link
+    WHERE rd.is_delivered = 'True' AND rd.name = ANY(:allowed_names)
+),
+dimension_stats AS (
+    SELECT {grain} AS grain,
+        domain, human_role_id, reviewer_id, name,
+        avg(score) AS average_score,
+        count(DISTINCT task_id) AS task_count
+    FROM base
+    GROUP BY GROUPING SETS ((domain, name), (human_role_id, name), (reviewer_id, name))
+),
+per_task AS (
+    SELECT {grain} AS grain,
+        domain, human_role_id, reviewer_id, task_id,
+        max(task_score) AS task_score,
+        max(rework_count) AS rework_count
+    FROM base
+    WHERE task_id IS NOT NULL
+    GROUP BY GROUPING SETS ((domain, task_id), (human_role_id, task_id), (reviewer_id, task_id))
+),
+group_stats AS (
+    SELECT grain, domain, human_role_id, reviewer_id,
+        count(*) AS task_count,
+        avg(task_score) AS average_task_score,
+        sum(rework_count) AS total_rework_count,
+        avg(rework_count) AS average_rework_count
+    FROM per_task
+    GROUP BY grain, domain, human_role_id, reviewer_id
+),
+agg_rows AS (
+    SELECT grain, domain, human_role_id, reviewer_id, name,
+        average_score, task_count,
+        NULL::float AS average_task_score, NULL::bigint AS total_rework_count, NULL::numeric AS average_rework_count
+    FROM dimension_stats
+    UNION ALL
+    SELECT grain, domain, human_role_id, reviewer_id, NULL AS name,
+        NULL AS average_score, task_count,
+        average_task_score, total_rework_count, average_rework_count
+    FROM group_stats
+)
+SELECT *,
+    {row_key} AS row_key,
+    CAST(:allowed_key AS text) AS allowed_key
+FROM agg_rows
+"""
+_CLIENT_DELIVERY_AGG_INDEX_SQL = (
+    "CREATE UNIQUE INDEX idx_mv_client_delivery_agg_key "
+    "ON mv_client_delivery_agg (row_key)"
+)
+
+# Materialized views kept current by refresh_review_aggregates: (view, CREATE sql, unique index sql)
+_AGGREGATE_VIEWS = (
+    (_REVIEW_AGG_VIEW, _REVIEW_AGG_VIEW_SQL.format(grain=_REVIEW_AGG_GRAIN, row_key=_AGG_ROW_KEY), _REVIEW_AGG_INDEX_SQL),
+    (
+        _CLIENT_DELIVERY_AGG_VIEW,
+        _CLIENT_DELIVERY_AGG_VIEW_SQL.format(grain=_CLIENT_DELIVERY_AGG_GRAIN, row_key=_AGG_ROW_KEY),
+        _CLIENT_DELIVERY_AGG_INDEX_SQL
+    ),
+)
+
+# Filters understood by _apply_review_filters, mapped to the clause each one adds
+_REVIEW_FILTERS = {
+    'domain': lambda value: ReviewDetail.domain == value,
+    'reviewer': lambda value: ReviewDetail.reviewer_id == int(value),
+    'trainer': lambda value: ReviewDetail.human_role_id == int(value),
+    'quality_dimension': lambda value: ReviewDetail.name == value,
+    'min_score': lambda value: ReviewDetail.score >= value,
+    'max_score': lambda value: ReviewDetail.score <= value,
+}
+
+# Score bounds apply whenever they are set (0 is a valid bound); the other
+# filters only when non-empty
+_SCORE_FILTER_KEYS = frozenset(('min_score', 'max_score'))
+
+# Group statistics the grouped aggregations can be sorted by (prefix with '-' for descending);
+# without sort_by groups are ordered by domain or contributor name
+AGGREGATION_SORT_KEYS = ('task_count', 'average_task_score', 'total_rework_count', 'average_rework_count')
+
+# Fixed-shape statements built once at import; SQLAlchemy's compiled cache then
+# serves the same entry on every call instead of rebuilding the construct
+_DELIVERY_DATE = func.date(WorkItem.delivery_date)
+_DELIVERY_TRACKER_STMT = select(
+    _DELIVERY_DATE.label('delivery_date'),
+    func.count(WorkItem.task_id).label('total_tasks'),
+    # NULL file names are dropped in the database
+    func.array_remove(func.array_agg(func.distinct(WorkItem.json_filename)), None).label('file_names')
+).where(
+    WorkItem.delivery_date.isnot(None)
+).group_by(
+    _DELIVERY_DATE
+).order_by(
+    _DELIVERY_DATE.desc()
+)
+
+# Count distinct task_ids directly from WorkItem (no JOIN with Task)
+# This ensures we count ALL delivered work items
+_WORK_ITEM_TASK_COUNT = select(
+    func.count(func.distinct(WorkItem.task_id))
+).where(
+    WorkItem.task_id.isnot(None)
+).scalar_subquery().label('task_count')
+
+# Count distinct work_item_ids
+_WORK_ITEM_COUNT = select(
+    func.count(func.distinct(WorkItem.work_item_id))
+).scalar_subquery().label('work_items_count')
+
+# Worker threads for running independent queries of one request concurrently
+_query_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="pg-query")
+
+
+@lru_cache(maxsize=512)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 date/datetime filter value, accepting a trailing 'Z' for UTC"""
+    return datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+
 
 class PostgresQueryService:
     """Service class for PostgreSQL query operations"""
@@ -23,11 +249,24 @@ class PostgresQueryService:
         self.settings = get_settings()
         self.db_service = get_db_service()
         self._allowed_quality_dimensions_cache: Optional[Set[str]] = None
+        self._allowed_quality_dimensions_expires_at: float = 0.0
+        # (generation, expires_at, contributor map); generation is bumped on refresh
+        # so a load that started before the refresh never repopulates the cache
+        self._contributor_map_cache: Optional[Tuple[int, float, Dict[int, Dict[str, str]]]] = None
+        self._contributor_cache_generation: int = 0
+        # Created on first use and reused so auth is done once per process
+        self._bq_client: Optional[bigquery.Client] = None
+    
+    def _get_bigquery_client(self) -> bigquery.Client:
+        """Return the shared BigQuery client, creating it on first use"""
+        if self._bq_client is None:
+            self._bq_client = bigquery.Client(project=self.settings.gcp_project_id)
+        return self._bq_client
     
     def _get_allowed_quality_dimensions(self, force_refresh: bool = False) -> Set[str]:
         """
         Fetch allowed quality dimensions for project_id 254 from BigQuery.
-        Results are cached to avoid repeated queries.
+        Results are cached for reference_cache_ttl_seconds to avoid repeated queries.
         
         Args:
             force_refresh: If True, bypass cache and fetch fresh data
@@ -35,23 +274,32 @@ class PostgresQueryService:
         Returns:
             Set of quality dimension names that are enabled for the project
         """
-        if not force_refresh and self._allowed_quality_dimensions_cache is not None:
+        if (not force_refresh
+                and self._allowed_quality_dimensions_cache is not None
+                and time.monotonic() < self._allowed_quality_dimensions_expires_at):
             return self._allowed_quality_dimensions_cache
         
         try:
-            # Initialize BigQuery client
-            client = bigquery.Client(project=self.settings.gcp_project_id)
+            client = self._get_bigquery_client()
             
-            query = f"""
+            # Parametrized so the query text is constant and BigQuery can serve it from its cache
+            query = """
             SELECT DISTINCT name 
             FROM `turing-gpt.prod_labeling_tool_z.project_quality_dimension` 
-            WHERE project_id = {self.settings.project_id_filter} AND is_enabled = 1
+            WHERE project_id = @project_id AND is_enabled = 1
             """
+            job_config = bigquery.QueryJobConfig(
+                query_parameters=[
+                    bigquery.ScalarQueryParameter("project_id", "INT64", self.settings.project_id_filter)
+                ],
+                use_query_cache=True
+            )
             
-            results = client.query(query).result()
+            results = client.query(query, job_config=job_config).result(max_results=1000)
             
             # Store in cache
             self._allowed_quality_dimensions_cache = {row.name for row in results if row.name}
+            self._allowed_quality_dimensions_expires_at = time.monotonic() + self.settings.reference_cache_ttl_seconds
             
             logger.info(f"Loaded {len(self._allowed_quality_dimensions_cache)} enabled quality dimensions for project 254")
             
@@ -59,7 +307,9 @@ class PostgresQueryService:
             
         except Exception as e:
             logger.error(f"Error fetching allowed quality dimensions: {e}")
-            # Return empty set on error to avoid breaking the application
+            # Serve the expired cache if we have one, otherwise an empty set to avoid breaking the application
+            if self._allowed_quality_dimensions_cache is not None:
+                return self._allowed_quality_dimensions_cache
             return set()
     
     def refresh_quality_dimensions_cache(self) -> None:
@@ -68,7 +318,17 @@ class PostgresQueryService:
         self._get_allowed_quality_dimensions(force_refresh=True)
     
     def _get_contributor_map(self) -> Dict[int, Dict[str, str]]:
-        """Get contributor ID to name, email, and status mapping"""
+        """
+        Get contributor ID to name, email, status, and display_name mapping
+        Cached for reference_cache_ttl_seconds since contributors change rarely
+        """
+        cached = self._contributor_map_cache
+        if cached is not None:
+            generation, expires_at, contributor_map = cached
+            if generation == self._contributor_cache_generation and time.monotonic() < expires_at:
+                return contributor_map
+        
+        generation = self._contributor_cache_generation
         try:
             with self.db_service.get_session() as session:
                 contributors = session.query(
@@ -77,17 +337,34 @@ class PostgresQueryService:
                     Contributor.turing_email,
                     Contributor.status
                 ).all()
-                return {
+                contributor_map = {
                     c.id: {
                         'name': c.name,
                         'email': c.turing_email,
-                        'status': c.status
+                        'status': c.status,
+                        # Precomputed so callers don't re-format per group/row
+                        'display_name': self._format_name_with_status(c.name, c.status)
                     } 
                     for c in contributors
                 }
         except Exception as e:
             logger.error(f"Error getting contributor map: {e}")
             return {}
+        
+        # Only store if no refresh happened while we were loading
+        if generation == self._contributor_cache_generation:
+            self._contributor_map_cache = (
+                generation,
+                time.monotonic() + self.settings.reference_cache_ttl_seconds,
+                contributor_map
+            )
+        return contributor_map
+    
+    def refresh_contributor_cache(self) -> None:
+        """Force refresh the contributor map cache from PostgreSQL"""
+        self._contributor_cache_generation += 1
+        self._contributor_map_cache = None
+        self._get_contributor_map()
     
     def _format_name_with_status(self, name: str, status: str) -> str:
         """
@@ -100,107 +377,373 @@ class PostgresQueryService:
         """
         if not name:
             return 'Unknown'
-        if not status or status.lower() == 'active':
+        status = (status or '').lower()
+        if not status or status == 'active':
             return name
-        return f"{name} ({status.lower()})"
+        return f"{name} ({status})"
+    
+    def _apply_review_filters(self, query, filters: Optional[Dict[str, Any]] = None):
+        """Apply the standard dashboard filters to an ORM query or Core select over ReviewDetail"""
+        clauses = [_REVIEW_FILTERS[key](value) for key, value in self._active_review_filters(filters)]
+        if clauses:
+            query = query.filter(*clauses)
+        return query
     
-    def _process_aggregation_results(self, results: List[Any], group_key: Optional[str] = None) -> List[Dict[str, Any]]:
+    def _build_filtered_review_query(self, filters: Optional[Dict[str, Any]], *columns, join_task: bool = True) -> Select:
         """
-        Process query results into structured aggregation format
-        Matches the logic from bigquery_service._process_aggregation_results
+        Build the shared pre-delivery select: review_detail LEFT JOIN task,
+        restricted to is_delivered = 'False' with the dashboard filters applied.
+        Filter values are bound parameters, so each filter combination compiles
+        to one statement that SQLAlchemy's compiled cache reuses across requests
         
         Args:
-            results: Raw results from PostgreSQL
-            group_key: The key to group by (domain, reviewer_id, human_role_id) or None for overall
+            filters: Optional dashboard filters
+            columns: Columns to select from ReviewDetail/Task
+            join_task: Whether to join task (only needed when selecting Task columns)
             
         Returns:
-            List of aggregated data
+            Core select statement
+        """
+        stmt = select(*columns).select_from(ReviewDetail)
+        if join_task:
+            stmt = stmt.outerjoin(Task, ReviewDetail.conversation_id == Task.id)
+        stmt = stmt.where(ReviewDetail.is_delivered == 'False')
+        return self._apply_review_filters(stmt, filters)
+    
+    def _active_review_filters(self, filters: Optional[Dict[str, Any]]) -> List[Tuple[str, Any]]:
+        """(key, value) pairs of the filters handled by _apply_review_filters that are set"""
+        active = []
+        if filters:
+            for key in _REVIEW_FILTERS:
+                value = filters.get(key)
+                if (value is not None) if key in _SCORE_FILTER_KEYS else value:
+                    active.append((key, value))
+        return active
+    
+    def _has_review_filters(self, filters: Optional[Dict[str, Any]]) -> bool:
+        """Whether any filter handled by _apply_review_filters is set"""
+        return bool(self._active_review_filters(filters))
+    
+    def _page_groups(self, group_stmt: Select, group_key: str, page: Tuple[Optional[str], Optional[int], int]) -> Select:
         """
-        # Group results by the group_key
-        grouped_data = defaultdict(lambda: defaultdict(lambda: {
-            'name': None,
-            'conversation_ids': set(),
-            'scores': [],
-            'task_scores': {},  # conversation_id -> task_score mapping
-            'rework_counts': {}  # conversation_id -> rework_count mapping
-        }))
+        Order and paginate a select returning one row per group
         
-        for row in results:
-            # Determine group value
-            if group_key:
-                group_value = getattr(row, group_key, None)
-            else:
-                group_value = 'overall'
+        Args:
+            group_stmt: Select with group_value and the AGGREGATION_SORT_KEYS columns
+            group_key: ReviewDetail column grouped by
+            page: (sort_by, limit, offset)
             
-            name = row.name
-            # Filter for Pre-Delivery: Only process allowed quality dimensions for project 254
-            allowed_dimensions = self._get_allowed_quality_dimensions()
-            if name and name in allowed_dimensions:
-                conversation_id = row.conversation_id
-                score = row.score
-                task_score = getattr(row, 'task_score', None)
-                rework_count = getattr(row, 'rework_count', None)
-                
-                grouped_data[group_value][name]['name'] = name
-                
-                if conversation_id is not None:
-                    grouped_data[group_value][name]['conversation_ids'].add(conversation_id)
-                    # Store task_score per conversation_id
-                    if task_score is not None:
-                        grouped_data[group_value][name]['task_scores'][conversation_id] = task_score
-                    # Store rework_count per conversation_id
-                    if rework_count is not None:
-                        grouped_data[group_value][name]['rework_counts'][conversation_id] = rework_count
-                
-                if score is not None:
-                    grouped_data[group_value][name]['scores'].append(score)
+        Returns:
+            Ordered select limited to the requested page of groups
+        """
+        sort_by, limit, offset = page
+        descending = bool(sort_by) and sort_by.startswith('-')
+        sort_key = sort_by.lstrip('-') if sort_by else None
         
-        # Convert to final format
-        result = []
-        for group_value, dimensions in grouped_data.items():
-            quality_dimensions = []
-            all_conversation_ids = set()
-            all_task_scores = {}  # conversation_id -> task_score mapping
-            all_rework_counts = {}  # conversation_id -> rework_count mapping (deduplicated)
+        groups = group_stmt.subquery()
+        stmt = select(groups)
+        if sort_key in AGGREGATION_SORT_KEYS:
+            sort_column = groups.c[sort_key]
+        elif group_key in ('human_role_id', 'reviewer_id'):
+            # Order by contributor name in SQL so only the requested page is returned
+            stmt = stmt.outerjoin(Contributor, Contributor.id == groups.c.group_value)
+            sort_column = func.coalesce(Contributor.name, 'Unknown')
+        else:
+            sort_column = groups.c.group_value
+        
+        sort_column = sort_column.desc() if descending else sort_column.asc()
+        stmt = stmt.order_by(sort_column.nulls_last(), groups.c.group_value)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        if offset:
+            stmt = stmt.offset(offset)
+        return stmt
+    
+    def _group_page(self, sort_by: Optional[str], limit: Optional[int], offset: int) -> Optional[Tuple[Optional[str], Optional[int], int]]:
+        """(sort_by, limit, offset) for _page_groups, or None when the request asks for no ordering or paging"""
+        if sort_by or limit is not None or offset:
+            return sort_by, limit, offset
+        return None
+    
+    def _in_groups(self, group_key: str, group_column, group_rows) -> Any:
+        """
+        Condition restricting group_column to the group values of the fetched page
+        group_rows (NULL included). The values are bound as one array parameter, so
+        the group aggregation is not run again and the statement text does not
+        depend on the page size
+        """
+        values = [row.group_value for row in group_rows]
+        group_values = bindparam(
+            'group_values',
+            [value for value in values if value is not None],
+            type_=ARRAY(getattr(ReviewDetail, group_key).type)
+        )
+        condition = group_column == any_(group_values)
+        if None in values:
+            condition = or_(condition, group_column.is_(None))
+        return condition
+    
+    def _query_pre_delivery_stats(self, session, filters: Optional[Dict[str, Any]], group_key: Optional[str],
+                                  allowed_dimensions: Set[str], page: Optional[Tuple[Optional[str], Optional[int], int]] = None):
+        """
+        Compute per-dimension and per-group pre-delivery statistics with live GROUP BY queries
+        
+        Args:
+            session: Active database session
+            filters: Optional dashboard filters
+            group_key: ReviewDetail column to group by or None for overall
+            allowed_dimensions: Quality dimension names to include
+            page: Optional (sort_by, limit, offset); group rows are then ordered and
+                paginated in SQL and dimension rows fetched only for those groups
             
-            for name, data in dimensions.items():
-                avg_score = None
-                if data['scores']:
-                    avg_score = sum(data['scores']) / len(data['scores'])
-                
-                all_conversation_ids.update(data['conversation_ids'])
-                # Collect all task scores for this group (deduplicated by conversation_id)
-                all_task_scores.update(data['task_scores'])
-                # Collect all rework counts for this group (deduplicated by conversation_id)
-                all_rework_counts.update(data['rework_counts'])
-                
-                quality_dimensions.append({
-                    'name': data['name'],
-                    'average_score': round(avg_score, 2) if avg_score is not None else None,
-                    'task_count': len(data['conversation_ids'])
-                })
+        Returns:
+            Tuple of (dimension_rows, group_rows)
+        """
+        group_columns = [getattr(ReviewDetail, group_key).label('group_value')] if group_key else []
+        
+        # Filtered pre-delivery rows; rework_count is joined later, once per conversation
+        base = self._build_filtered_review_query(
+            filters,
+            *group_columns,
+            ReviewDetail.name,
+            ReviewDetail.score,
+            ReviewDetail.conversation_id,
+            ReviewDetail.task_score,
+            join_task=False
+        ).where(
+            ReviewDetail.name.in_(allowed_dimensions)
+        ).subquery()
+        base_group_by = [base.c.group_value] if group_key else []
+        
+        # Per group: statistics over distinct conversations, joining task for
+        # rework_count once per conversation instead of once per review row.
+        # Rows without a conversation are kept (and excluded from the statistics)
+        # so every group has a stats row and can be paged
+        per_task = select(
+            *base_group_by,
+            base.c.conversation_id,
+            func.max(base.c.task_score).label('task_score')
+        ).group_by(*base_group_by, base.c.conversation_id).subquery()
+        per_task_group_by = [per_task.c.group_value] if group_key else []
+        has_conversation = per_task.c.conversation_id.isnot(None)
+        
+        group_stmt = select(
+            *per_task_group_by,
+            func.count(per_task.c.conversation_id).label('task_count'),
+            func.avg(per_task.c.task_score).filter(has_conversation).label('average_task_score'),
+            func.sum(Task.rework_count).label('total_rework_count'),
+            func.avg(Task.rework_count).label('average_rework_count')
+        ).select_from(per_task).outerjoin(
+            Task, per_task.c.conversation_id == Task.id
+        ).group_by(*per_task_group_by)
+        if page is not None:
+            group_stmt = self._page_groups(group_stmt, group_key, page)
+        group_rows = session.execute(group_stmt).all()
+        
+        # Per quality dimension: average score and distinct task count
+        dimension_stmt = select(
+            *base_group_by,
+            base.c.name,
+            func.avg(base.c.score).label('average_score'),
+            func.count(func.distinct(base.c.conversation_id)).label('task_count')
+        ).group_by(*base_group_by, base.c.name)
+        if page is not None:
+            dimension_stmt = dimension_stmt.where(self._in_groups(group_key, base.c.group_value, group_rows))
+        dimension_rows = session.execute(dimension_stmt).all()
+        
+        return dimension_rows, group_rows
+    
+    def _allowed_dimensions_key(self, allowed_dimensions: Set[str]) -> str:
+        """Fingerprint of the allowed quality dimension set (and view version) stored in the aggregate views"""
+        fingerprint = "\n".join([f"v{_AGGREGATE_VIEW_VERSION}", *sorted(allowed_dimensions)])
+        return hashlib.md5(fingerprint.encode("utf-8")).hexdigest()
+    
+    def _read_review_agg_view(self, session, group_key: Optional[str], allowed_dimensions: Set[str],
+                              page: Optional[Tuple[Optional[str], Optional[int], int]] = None):
+        """
+        Read pre-aggregated statistics from mv_review_agg
+        
+        Args:
+            session: Active database session
+            group_key: ReviewDetail column to group by or None for overall
+            allowed_dimensions: Quality dimension names the view must have been built for
+            page: Optional (sort_by, limit, offset) applied to the group rows in SQL
             
-            # Sort by name for consistency
-            quality_dimensions.sort(key=lambda x: x['name'])
+        Returns:
+            Tuple of (dimension_rows, group_rows), or None if the view is missing,
+            empty, or was built for a different set of allowed dimensions
+        """
+        if not allowed_dimensions:
+            return None
+        if not session.execute(text("SELECT to_regclass(:view) IS NOT NULL"), {"view": _REVIEW_AGG_VIEW}).scalar():
+            return None
+        
+        view = table(
+            _REVIEW_AGG_VIEW,
+            column('grain'), column('domain'), column('reviewer_id'), column('human_role_id'),
+            column('name'), column('average_score'), column('task_count'),
+            column('average_task_score'), column('total_rework_count'), column('average_rework_count'),
+            column('allowed_key')
+        )
+        group_columns = [view.c[group_key].label('group_value')] if group_key else []
+        in_view = (
+            view.c.grain == (group_key or 'overall'),
+            view.c.allowed_key == self._allowed_dimensions_key(allowed_dimensions)
+        )
+        
+        if page is None:
+            rows = session.execute(
+                select(
+                    *group_columns,
+                    view.c.name,
+                    view.c.average_score,
+                    view.c.task_count,
+                    view.c.average_task_score,
+                    view.c.total_rework_count,
+                    view.c.average_rework_count
+                ).where(*in_view)
+            ).all()
+            if not rows:
+                return None
             
-            # Calculate average task score for this group (using deduplicated values)
-            average_task_score = None
-            if all_task_scores:
-                task_score_values = list(all_task_scores.values())
-                average_task_score = round(sum(task_score_values) / len(task_score_values), 2)
+            dimension_rows = [row for row in rows if row.name is not None]
+            group_rows = [row for row in rows if row.name is None]
+            return dimension_rows, group_rows
+        
+        # Paginated: pick the page of group rows first, then their dimension rows
+        group_rows = session.execute(
+            self._page_groups(
+                select(
+                    *group_columns,
+                    view.c.task_count,
+                    view.c.average_task_score,
+                    view.c.total_rework_count,
+                    view.c.average_rework_count
+                ).where(*in_view, view.c.name.is_(None)),
+                group_key,
+                page
+            )
+        ).all()
+        if not group_rows:
+            # Tell an out-of-range page apart from a view that is empty or stale
+            has_rows = session.execute(select(true()).where(*in_view).limit(1)).scalar()
+            return ([], []) if has_rows else None
+        
+        dimension_rows = session.execute(
+            select(
+                *group_columns,
+                view.c.name,
+                view.c.average_score,
+                view.c.task_count
+            ).where(*in_view, view.c.name.isnot(None), self._in_groups(group_key, view.c[group_key], group_rows))
+        ).all()
+        return dimension_rows, group_rows
+    
+    def refresh_review_aggregates(self) -> bool:
+        """
+        Refresh mv_review_agg and mv_client_delivery_agg after a data import.
+        A view is rebuilt when it is missing or the allowed quality dimensions
+        changed, otherwise refreshed concurrently so readers are never blocked.
+        A view that cannot be brought up to date is dropped, so readers fall back
+        to live queries instead of serving data from before the import
+        
+        Returns:
+            True if both views are up to date
+        """
+        allowed_dimensions = self._get_allowed_quality_dimensions()
+        if not allowed_dimensions:
+            logger.warning("No allowed quality dimensions, dropping aggregate views instead of refreshing them")
+            for view, _, _ in _AGGREGATE_VIEWS:
+                self._drop_aggregate_view(view)
+            return False
+        
+        allowed_key = self._allowed_dimensions_key(allowed_dimensions)
+        up_to_date = True
+        for view, view_sql, index_sql in _AGGREGATE_VIEWS:
+            try:
+                with self.db_service.get_session() as session:
+                    current_key = None
+                    if session.execute(text("SELECT to_regclass(:view) IS NOT NULL"), {"view": view}).scalar():
+                        current_key = session.execute(text(f"SELECT allowed_key FROM {view} LIMIT 1")).scalar()
+                    
+                    if current_key == allowed_key:
+                        session.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+                        logger.info(f"✓ Refreshed {view}")
+                    else:
+                        session.execute(text(f"DROP MATERIALIZED VIEW IF EXISTS {view}"))
+                        session.execute(
+                            text(view_sql),
+                            {"allowed_names": sorted(allowed_dimensions), "allowed_key": allowed_key}
+                        )
+                        session.execute(text(index_sql))
+                        logger.info(f"✓ Rebuilt {view}")
+            except Exception as e:
+                logger.error(f"Error refreshing {view}: {e}")
+                self._drop_aggregate_view(view)
+                up_to_date = False
+        return up_to_date
+    
+    def _drop_aggregate_view(self, view: str) -> None:
+        """Drop a stale aggregate view; it is rebuilt by the next successful refresh"""
+        try:
+            with self.db_service.get_session() as session:
+                session.execute(text(f"DROP MATERIALIZED VIEW IF EXISTS {view}"))
+            logger.warning(f"Dropped stale {view}, serving live queries until it is rebuilt")
+        except Exception as e:
+            logger.error(f"Error dropping stale {view}: {e}")
+    
+    def _aggregate_pre_delivery(self, session, filters: Optional[Dict[str, Any]] = None, group_key: Optional[str] = None,
+                                sort_by: Optional[str] = None, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        Aggregate pre-delivery review_detail rows in PostgreSQL
+        Only allowed quality dimensions are included; task_score and rework_count
+        are deduplicated per conversation before group-level statistics are computed.
+        Unfiltered requests read mv_review_agg, filtered ones run live GROUP BY queries
+        
+        Args:
+            session: Active database session
+            filters: Optional dashboard filters
+            group_key: ReviewDetail column to group by (domain, reviewer_id, human_role_id) or None for overall
+            sort_by: Group ordering (see AGGREGATION_SORT_KEYS), applied in SQL
+            limit: Maximum number of groups to return
+            offset: Number of groups to skip
             
-            # Calculate rework statistics (using deduplicated values)
-            rework_count_values = list(all_rework_counts.values())
-            total_rework_count = sum(rework_count_values) if rework_count_values else 0
-            average_rework_count = round(sum(rework_count_values) / len(rework_count_values), 2) if rework_count_values else 0
+        Returns:
+            List of aggregated data, in the requested group order when sort_by, limit
+            or offset is given (otherwise unordered)
+        """
+        allowed_dimensions = self._get_allowed_quality_dimensions()
+        page = self._group_page(sort_by, limit, offset) if group_key else None
+        
+        # Unfiltered requests are served from the materialized view when it is current
+        view_rows = None
+        if not self._has_review_filters(filters):
+            view_rows = self._read_review_agg_view(session, group_key, allowed_dimensions, page)
+        if view_rows is not None:
+            dimension_rows, group_rows = view_rows
+        else:
+            dimension_rows, group_rows = self._query_pre_delivery_stats(session, filters, group_key, allowed_dimensions, page)
+        
+        group_stats = {(row.group_value if group_key else None): row for row in group_rows}
+        
+        # Collect quality dimensions per group
+        dimensions_by_group = defaultdict(list)
+        for row in dimension_rows:
+            group_value = row.group_value if group_key else None
+            dimensions_by_group[group_value].append(self._format_dimension_row(row))
+        
+        # Convert to final format, keeping the SQL order of the group rows
+        # (every group with dimension rows has a group row)
+        result = []
+        for group_value, stats in group_stats.items():
+            quality_dimensions = dimensions_by_group.get(group_value)
+            if not quality_dimensions:
+                continue
+            # Sort by name for consistency
+            quality_dimensions.sort(key=lambda x: x['name'])
             
-            item = {
-                'task_count': len(all_conversation_ids),
-                'average_task_score': average_task_score,
-                'total_rework_count': total_rework_count,
-                'average_rework_count': average_rework_count,
-                'quality_dimensions': quality_dimensions
-            }
+            item = self._format_group_stats(stats)
+            item['quality_dimensions'] = quality_dimensions
             
             if group_key:
                 item[group_key] = group_value
@@ -209,369 +752,406 @@ class PostgresQueryService:
         
         return result
     
-    def _process_client_delivery_aggregation(self, results, group_key=None):
+    def _aggregate_pre_delivery_overall(self, session, filters: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """
-        Process aggregation results for client delivery (counts based on work_item.task_id)
+        Overall (ungrouped) variant of _aggregate_pre_delivery
+        There is a single group, so rows are formatted directly without per-group bookkeeping
         
         Args:
-            results: Query results with domain/name/score/task_score/task_id/rework_count fields
-            group_key: Key to group by (e.g., 'domain', 'human_role_id', 'reviewer_id')
+            session: Active database session
+            filters: Optional dashboard filters
             
         Returns:
-            List of aggregated data
+            Overall aggregation, or None if no allowed quality dimension rows match
         """
-        # Group results by the group_key
-        grouped_data = defaultdict(lambda: defaultdict(lambda: {
-            'name': None,
-            'task_ids': set(),  # Changed from conversation_ids to task_ids
-            'scores': [],
-            'task_scores': {},  # task_id -> task_score mapping
-            'rework_counts': {}  # task_id -> rework_count mapping
-        }))
+        allowed_dimensions = self._get_allowed_quality_dimensions()
         
-        for row in results:
-            # Determine group value
-            if group_key:
-                group_value = getattr(row, group_key, None)
-            else:
-                group_value = 'overall'
-            
-            name = row.name
-            # Filter for Post-Delivery: Only process allowed quality dimensions for project 254
-            allowed_dimensions = self._get_allowed_quality_dimensions()
-            if name and name in allowed_dimensions:
-                task_id = row.task_id  # Use work_item.task_id
-                score = row.score
-                task_score = getattr(row, 'task_score', None)
-                rework_count = getattr(row, 'rework_count', None)
-                
-                grouped_data[group_value][name]['name'] = name
-                
-                if task_id is not None:
-                    grouped_data[group_value][name]['task_ids'].add(task_id)
-                    # Store task_score per task_id
-                    if task_score is not None:
-                        grouped_data[group_value][name]['task_scores'][task_id] = task_score
-                    # Store rework_count per task_id (deduplicated by task_id)
-                    if rework_count is not None:
-                        grouped_data[group_value][name]['rework_counts'][task_id] = rework_count
-                
-                if score is not None:
-                    grouped_data[group_value][name]['scores'].append(score)
+        view_rows = None
+        if not self._has_review_filters(filters):
+            view_rows = self._read_review_agg_view(session, None, allowed_dimensions)
+        if view_rows is not None:
+            dimension_rows, group_rows = view_rows
+        else:
+            dimension_rows, group_rows = self._query_pre_delivery_stats(session, filters, None, allowed_dimensions)
         
-        # Convert to final format
-        result = []
-        for group_value, dimensions in grouped_data.items():
-            quality_dimensions = []
-            all_task_ids = set()
-            all_task_scores = {}  # Deduplicated by task_id
-            all_rework_counts = {}  # Deduplicated by task_id
-            
-            for name, data in dimensions.items():
-                avg_score = None
-                if data['scores']:
-                    avg_score = sum(data['scores']) / len(data['scores'])
-                
-                all_task_ids.update(data['task_ids'])
-                # Collect all task scores for this group (deduplicated)
-                all_task_scores.update(data['task_scores'])
-                # Collect all rework counts for this group (deduplicated)
-                all_rework_counts.update(data['rework_counts'])
-                
-                quality_dimensions.append({
-                    'name': data['name'],
-                    'average_score': round(avg_score, 2) if avg_score is not None else None,
-                    'task_count': len(data['task_ids'])  # Count distinct task_ids
-                })
-            
-            # Sort by name for consistency
-            quality_dimensions.sort(key=lambda x: x['name'])
-            
-            # Calculate average task score for this group (using deduplicated values)
-            average_task_score = None
-            if all_task_scores:
-                task_score_values = list(all_task_scores.values())
-                average_task_score = round(sum(task_score_values) / len(task_score_values), 2)
+        if not dimension_rows:
+            return None
+        
+        overall = self._format_group_stats(group_rows[0] if group_rows else None)
+        overall['quality_dimensions'] = sorted(
+            (self._format_dimension_row(row) for row in dimension_rows),
+            key=lambda x: x['name']
+        )
+        return overall
+    
+    def _format_dimension_row(self, row) -> Dict[str, Any]:
+        """Format a per-dimension statistics row for the API response"""
+        return {
+            'name': row.name,
+            'average_score': round(float(row.average_score), 2) if row.average_score is not None else None,
+            'task_count': row.task_count
+        }
+    
+    def _format_group_stats(self, stats) -> Dict[str, Any]:
+        """Format a per-group statistics row (or None when missing) for the API response"""
+        average_task_score = None
+        total_rework_count = 0
+        average_rework_count = 0
+        if stats is not None:
+            if stats.average_task_score is not None:
+                average_task_score = round(float(stats.average_task_score), 2)
+            if stats.total_rework_count is not None:
+                total_rework_count = int(stats.total_rework_count)
+            if stats.average_rework_count is not None:
+                average_rework_count = round(float(stats.average_rework_count), 2)
+        
+        return {
+            'task_count': stats.task_count if stats is not None else 0,
+            'average_task_score': average_task_score,
+            'total_rework_count': total_rework_count,
+            'average_rework_count': average_rework_count
+        }
+    
+    def _build_client_delivery_query(self, filters: Optional[Dict[str, Any]], *group_columns) -> Select:
+        """
+        Build the client-delivery select: review_detail JOIN task JOIN work_item,
+        restricted to delivered rows of allowed quality dimensions with the dashboard
+        filters applied. Every column is labelled explicitly so the column names
+        used by the aggregation never depend on implicit naming
+        
+        Args:
+            filters: Optional dashboard filters
+            group_columns: ReviewDetail columns to group by
             
-            # Calculate rework statistics (using deduplicated values)
-            rework_count_values = list(all_rework_counts.values())
-            total_rework_count = sum(rework_count_values) if rework_count_values else 0
-            average_rework_count = round(sum(rework_count_values) / len(rework_count_values), 2) if rework_count_values else 0
+        Returns:
+            Core select statement
+        """
+        stmt = select(
+            *(group_column.label(group_column.key) for group_column in group_columns),
+            ReviewDetail.name.label('name'),
+            ReviewDetail.score.label('score'),
+            ReviewDetail.task_score.label('task_score'),
+            WorkItem.task_id.label('task_id'),
+            Task.rework_count.label('rework_count')
+        ).select_from(ReviewDetail).join(
+            Task, ReviewDetail.conversation_id == Task.id
+        ).join(
+            WorkItem, Task.colab_link == WorkItem.colab_link
+        ).where(
+            ReviewDetail.is_delivered == 'True',
+            # Only allowed quality dimensions leave the database
+            ReviewDetail.name.in_(self._get_allowed_quality_dimensions())
+        )
+        return self._apply_review_filters(stmt, filters)
+    
+    def _query_client_delivery_stats(self, session, filters: Optional[Dict[str, Any]] = None):
+        """
+        Compute client-delivery statistics for the domain, trainer and reviewer
+        groupings in one pass over the review_detail/task/work_item join using
+        GROUPING SETS. Counts are based on distinct work_item.task_id, and
+        task_score/rework_count are deduplicated per task_id within each group
+        
+        Args:
+            session: Active database session
+            filters: Optional dashboard filters
             
-            item = {
-                'task_count': len(all_task_ids),  # Count distinct task_ids
-                'average_task_score': average_task_score,
-                'total_rework_count': total_rework_count,
-                'average_rework_count': average_rework_count,
-                'quality_dimensions': quality_dimensions
-            }
+        Returns:
+            Tuple of (dimension_rows, group_rows); each row has a grain column naming
+            the group key (domain, human_role_id or reviewer_id) it belongs to, and
+            trainer/reviewer group rows carry the contributor's name, email and status
+        """
+        base = self._build_client_delivery_query(
+            filters, ReviewDetail.domain, ReviewDetail.human_role_id, ReviewDetail.reviewer_id
+        ).subquery()
+        group_columns = (base.c.domain, base.c.human_role_id, base.c.reviewer_id)
+        grain = case(
+            (func.grouping(base.c.domain) == 0, 'domain'),
+            (func.grouping(base.c.human_role_id) == 0, 'human_role_id'),
+            else_='reviewer_id'
+        ).label('grain')
+        
+        # Per group and quality dimension: average score and distinct task_ids
+        dimension_rows = session.execute(
+            select(
+                grain,
+                *group_columns,
+                base.c.name,
+                func.avg(base.c.score).label('average_score'),
+                func.count(func.distinct(base.c.task_id)).label('task_count')
+            ).group_by(
+                func.grouping_sets(*(tuple_(group_column, base.c.name) for group_column in group_columns))
+            ).order_by(*group_columns)
+        ).all()
+        
+        # Per group: statistics over distinct task_ids
+        per_task = select(
+            grain,
+            *group_columns,
+            base.c.task_id,
+            func.max(base.c.task_score).label('task_score'),
+            func.max(base.c.rework_count).label('rework_count')
+        ).where(
+            base.c.task_id.isnot(None)
+        ).group_by(
+            func.grouping_sets(*(tuple_(group_column, base.c.task_id) for group_column in group_columns))
+        ).subquery()
+        
+        # Only one of human_role_id/reviewer_id is set outside the domain grain,
+        # so the contributor is joined on whichever the row is grouped by
+        group_rows = session.execute(
+            select(
+                per_task.c.grain,
+                per_task.c.domain,
+                per_task.c.human_role_id,
+                per_task.c.reviewer_id,
+                func.max(Contributor.name).label('contributor_name'),
+                func.max(Contributor.turing_email).label('contributor_email'),
+                func.max(Contributor.status).label('contributor_status'),
+                func.count().label('task_count'),
+                func.avg(per_task.c.task_score).label('average_task_score'),
+                func.sum(per_task.c.rework_count).label('total_rework_count'),
+                func.avg(per_task.c.rework_count).label('average_rework_count')
+            ).outerjoin(
+                Contributor,
+                Contributor.id == func.coalesce(per_task.c.human_role_id, per_task.c.reviewer_id)
+            ).group_by(
+                per_task.c.grain, per_task.c.domain, per_task.c.human_role_id, per_task.c.reviewer_id
+            )
+        ).all()
+        
+        return dimension_rows, group_rows
+    
+    def _read_client_delivery_agg_view(self, session, allowed_dimensions: Set[str]):
+        """
+        Read pre-aggregated client-delivery statistics from mv_client_delivery_agg
+        
+        Args:
+            session: Active database session
+            allowed_dimensions: Quality dimension names the view must have been built for
             
-            if group_key:
-                item[group_key] = group_value
+        Returns:
+            Tuple of (dimension_rows, group_rows) shaped like _query_client_delivery_stats,
+            or None if the view is missing, empty, or was built for a different set of
+            allowed dimensions
+        """
+        if not allowed_dimensions:
+            return None
+        if not session.execute(text("SELECT to_regclass(:view) IS NOT NULL"), {"view": _CLIENT_DELIVERY_AGG_VIEW}).scalar():
+            return None
+        
+        view = table(
+            _CLIENT_DELIVERY_AGG_VIEW,
+            column('grain'), column('domain'), column('human_role_id'), column('reviewer_id'),
+            column('name'), column('average_score'), column('task_count'),
+            column('average_task_score'), column('total_rework_count'), column('average_rework_count'),
+            column('allowed_key')
+        )
+        rows = session.execute(
+            select(
+                view.c.grain,
+                view.c.domain,
+                view.c.human_role_id,
+                view.c.reviewer_id,
+                view.c.name,
+                view.c.average_score,
+                view.c.task_count,
+                view.c.average_task_score,
+                view.c.total_rework_count,
+                view.c.average_rework_count,
+                Contributor.name.label('contributor_name'),
+                Contributor.turing_email.label('contributor_email'),
+                Contributor.status.label('contributor_status')
+            ).select_from(view).outerjoin(
+                # Only group rows need the contributor; dimension rows skip the join
+                Contributor,
+                (view.c.name.is_(None))
+                & (Contributor.id == func.coalesce(view.c.human_role_id, view.c.reviewer_id))
+            ).where(
+                view.c.allowed_key == self._allowed_dimensions_key(allowed_dimensions)
+            ).order_by(view.c.domain, view.c.human_role_id, view.c.reviewer_id)
+        ).all()
+        if not rows:
+            return None
+        
+        dimension_rows = [row for row in rows if row.name is not None]
+        group_rows = [row for row in rows if row.name is None]
+        return dimension_rows, group_rows
+    
+    def _get_overall_counts(self, session, filters: Optional[Dict[str, Any]] = None):
+        """
+        Get the scalar counts for the overall endpoint in a single round trip
+        
+        Args:
+            session: Active database session
+            filters: Optional dashboard filters
             
-            result.append(item)
+        Returns:
+            Row with task/reviewer/trainer/domain counts and work_item stats
+        """
+        # Unique reviewer/trainer/domain counts across all filtered pre-delivery rows
+        unique_counts = self._apply_review_filters(
+            select(
+                func.count(func.distinct(ReviewDetail.reviewer_id)).label('reviewer_count'),
+                func.count(func.distinct(ReviewDetail.human_role_id)).label('trainer_count'),
+                func.count(func.distinct(func.nullif(ReviewDetail.domain, ''))).label('domain_count')
+            ).where(ReviewDetail.is_delivered == 'False'),
+            filters
+        ).subquery()
         
-        return result
+        # Get the actual task count from Task table (not ReviewDetail) for pre-delivery
+        # This gives us the correct count of unique tasks that haven't been delivered yet
+        task_count_query = select(func.count(func.distinct(Task.id))).where(
+            Task.is_delivered == 'False'
+        )
+        # Apply filters if provided
+        if filters:
+            if filters.get('domain'):
+                task_count_query = task_count_query.where(Task.domain == filters['domain'])
+            if filters.get('trainer'):
+                task_count_query = task_count_query.where(Task.current_user_id == int(filters['trainer']))
+        
+        # Get work_item stats (delivered tasks and files); COUNT(DISTINCT) skips NULLs
+        work_item_counts = select(
+            func.count(func.distinct(WorkItem.task_id)).label('delivered_tasks'),
+            func.count(func.distinct(WorkItem.json_filename)).label('delivered_files'),
+            func.count(func.distinct(WorkItem.work_item_id)).label('work_items_count')
+        ).subquery()
+        
+        # Each part returns one row, so combine them into a single round trip
+        return session.execute(
+            select(
+                task_count_query.scalar_subquery().label('task_count'),
+                unique_counts,
+                work_item_counts
+            ).select_from(unique_counts.join(work_item_counts, true()))
+        ).one()
+    
+    def _run_in_session(self, query_fn, *args):
+        """Run query_fn(session, *args) in its own session (for use from worker threads)"""
+        with self.db_service.get_session() as session:
+            return query_fn(session, *args)
     
+    @cached_aggregation()
     def get_overall_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get overall aggregation statistics"""
         try:
-            with self.db_service.get_session() as session:
-                # Get all review_detail records where is_delivered = 'False' (Pre-Delivery only)
-                # Join with Task to get rework_count
-                query = session.query(ReviewDetail, Task.rework_count).outerjoin(
-                    Task, ReviewDetail.conversation_id == Task.id
-                ).filter(ReviewDetail.is_delivered == 'False')
-                
-                # Apply filters if provided
-                if filters:
-                    if filters.get('domain'):
-                        query = query.filter(ReviewDetail.domain == filters['domain'])
-                    if filters.get('reviewer'):
-                        query = query.filter(ReviewDetail.reviewer_id == int(filters['reviewer']))
-                    if filters.get('trainer'):
-                        query = query.filter(ReviewDetail.human_role_id == int(filters['trainer']))
-                    if filters.get('quality_dimension'):
-                        query = query.filter(ReviewDetail.name == filters['quality_dimension'])
-                    if filters.get('min_score') is not None:
-                        query = query.filter(ReviewDetail.score >= filters['min_score'])
-                    if filters.get('max_score') is not None:
-                        query = query.filter(ReviewDetail.score <= filters['max_score'])
-                
-                results = query.all()
-                
-                # Convert results to include rework_count as attribute
-                processed_results = []
-                for review_detail, rework_count in results:
-                    review_detail.rework_count = rework_count
-                    processed_results.append(review_detail)
-                
-                # Process aggregation
-                aggregated = self._process_aggregation_results(processed_results, group_key=None)
-                
-                if not aggregated:
-                    return {
-                        'task_count': 0,
-                        'reviewer_count': 0,
-                        'trainer_count': 0,
-                        'domain_count': 0,
-                        'delivered_tasks': 0,
-                        'delivered_files': 0,
-                        'work_items_count': 0,
-                        'quality_dimensions': []
-                    }
-                
-                # Calculate unique counts
-                unique_reviewers = set()
-                unique_trainers = set()
-                unique_domains = set()
-                
-                for review_detail, rework_count in results:
-                    if review_detail.reviewer_id:
-                        unique_reviewers.add(review_detail.reviewer_id)
-                    if review_detail.human_role_id:
-                        unique_trainers.add(review_detail.human_role_id)
-                    if review_detail.domain:
-                        unique_domains.add(review_detail.domain)
-                
-                # Import func and distinct for counting queries
-                from app.models.db_models import WorkItem
-                
-                # Get the actual task count from Task table (not ReviewDetail) for pre-delivery
-                # This gives us the correct count of unique tasks that haven't been delivered yet
-                task_count_query = session.query(func.count(func.distinct(Task.id))).filter(
-                    Task.is_delivered == 'False'
-                )
-                # Apply filters if provided
-                if filters:
-                    if filters.get('domain'):
-                        task_count_query = task_count_query.filter(Task.domain == filters['domain'])
-                    if filters.get('trainer'):
-                        task_count_query = task_count_query.filter(Task.current_user_id == int(filters['trainer']))
-                
-                actual_task_count = task_count_query.scalar() or 0
-                
-                # Get work_item stats (delivered tasks and files)
-                
-                delivered_tasks = session.query(func.count(func.distinct(WorkItem.task_id))).filter(
-                    WorkItem.task_id.isnot(None)
-                ).scalar() or 0
-                delivered_files = session.query(func.count(func.distinct(WorkItem.json_filename))).filter(
-                    WorkItem.json_filename.isnot(None)
-                ).scalar() or 0
-                work_items_count = session.query(func.count(func.distinct(WorkItem.work_item_id))).scalar() or 0
-                
-                overall_data = aggregated[0]
-                # Use the actual task count from Task table instead of from ReviewDetail
-                overall_data['task_count'] = actual_task_count
-                overall_data['reviewer_count'] = len(unique_reviewers)
-                overall_data['trainer_count'] = len(unique_trainers)
-                overall_data['domain_count'] = len(unique_domains)
-                overall_data['delivered_tasks'] = delivered_tasks
-                overall_data['delivered_files'] = delivered_files
-                overall_data['work_items_count'] = work_items_count
-                
-                return overall_data
+            # The aggregation and the counts are independent, so run them
+            # concurrently on separate pooled connections
+            aggregated_future = _query_executor.submit(
+                self._run_in_session, self._aggregate_pre_delivery_overall, filters
+            )
+            counts_future = _query_executor.submit(
+                self._run_in_session, self._get_overall_counts, filters
+            )
+            overall_data = aggregated_future.result()
+            counts = counts_future.result()
+            
+            if overall_data is None:
+                return {
+                    'task_count': 0,
+                    'reviewer_count': 0,
+                    'trainer_count': 0,
+                    'domain_count': 0,
+                    'delivered_tasks': 0,
+                    'delivered_files': 0,
+                    'work_items_count': 0,
+                    'quality_dimensions': []
+                }
+            
+            # Use the actual task count from Task table instead of from ReviewDetail
+            overall_data['task_count'] = counts.task_count or 0
+            overall_data['reviewer_count'] = counts.reviewer_count
+            overall_data['trainer_count'] = counts.trainer_count
+            overall_data['domain_count'] = counts.domain_count
+            overall_data['delivered_tasks'] = counts.delivered_tasks or 0
+            overall_data['delivered_files'] = counts.delivered_files or 0
+            overall_data['work_items_count'] = counts.work_items_count or 0
+            
+            return overall_data
         except Exception as e:
             logger.error(f"Error getting overall aggregation: {e}")
             raise
     
-    def get_domain_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """Get domain-wise aggregation statistics"""
+    @cached_aggregation()
+    def get_domain_aggregation(self, filters: Optional[Dict[str, Any]] = None, sort_by: Optional[str] = None,
+                               limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        """Get domain-wise aggregation statistics (ordered by domain name or sort_by, paginated in SQL)"""
         try:
             with self.db_service.get_session() as session:
-                # Get all review_detail records where is_delivered = 'False' (Pre-Delivery only)
-                # Join with Task to get rework_count
-                query = session.query(ReviewDetail, Task.rework_count).outerjoin(
-                    Task, ReviewDetail.conversation_id == Task.id
-                ).filter(ReviewDetail.is_delivered == 'False')
-                
-                # Apply filters if provided
-                if filters:
-                    if filters.get('domain'):
-                        query = query.filter(ReviewDetail.domain == filters['domain'])
-                    if filters.get('reviewer'):
-                        query = query.filter(ReviewDetail.reviewer_id == int(filters['reviewer']))
-                    if filters.get('trainer'):
-                        query = query.filter(ReviewDetail.human_role_id == int(filters['trainer']))
-                    if filters.get('quality_dimension'):
-                        query = query.filter(ReviewDetail.name == filters['quality_dimension'])
-                    if filters.get('min_score') is not None:
-                        query = query.filter(ReviewDetail.score >= filters['min_score'])
-                    if filters.get('max_score') is not None:
-                        query = query.filter(ReviewDetail.score <= filters['max_score'])
-                
-                results = query.all()
-                
-                # Convert results to include rework_count as attribute
-                processed_results = []
-                for review_detail, rework_count in results:
-                    review_detail.rework_count = rework_count
-                    processed_results.append(review_detail)
-                
-                # Process aggregation by domain
-                aggregated = self._process_aggregation_results(processed_results, group_key='domain')
+                # Aggregate pre-delivery rows (is_delivered = 'False') in PostgreSQL
+                aggregated = self._aggregate_pre_delivery(
+                    session, filters, group_key='domain', sort_by=sort_by, limit=limit, offset=offset
+                )
                 
                 # Format for API response
                 for item in aggregated:
                     item['domain'] = item.pop('domain', 'Unknown')
                 
-                # Sort by domain name
-                aggregated.sort(key=lambda x: x.get('domain', ''))
+                # Without paging options SQL returns groups unordered; sort by domain name
+                if self._group_page(sort_by, limit, offset) is None:
+                    aggregated.sort(key=lambda x: (x['domain'] is None, x['domain'] or ''))
                 
                 return aggregated
         except Exception as e:
             logger.error(f"Error getting domain aggregation: {e}")
             raise
     
-    def get_trainer_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """Get trainer-wise aggregation statistics"""
+    @cached_aggregation()
+    def get_trainer_aggregation(self, filters: Optional[Dict[str, Any]] = None, sort_by: Optional[str] = None,
+                                limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        """Get trainer-wise aggregation statistics (ordered by trainer name or sort_by, paginated in SQL)"""
         try:
             # Get contributor map for names
             contributor_map = self._get_contributor_map()
             
             with self.db_service.get_session() as session:
-                # Get all review_detail records where is_delivered = 'False' (Pre-Delivery only)
-                # Join with Task to get rework_count
-                query = session.query(ReviewDetail, Task.rework_count).outerjoin(
-                    Task, ReviewDetail.conversation_id == Task.id
-                ).filter(ReviewDetail.is_delivered == 'False')
-                
-                # Apply filters if provided
-                if filters:
-                    if filters.get('domain'):
-                        query = query.filter(ReviewDetail.domain == filters['domain'])
-                    if filters.get('reviewer'):
-                        query = query.filter(ReviewDetail.reviewer_id == int(filters['reviewer']))
-                    if filters.get('trainer'):
-                        query = query.filter(ReviewDetail.human_role_id == int(filters['trainer']))
-                    if filters.get('quality_dimension'):
-                        query = query.filter(ReviewDetail.name == filters['quality_dimension'])
-                    if filters.get('min_score') is not None:
-                        query = query.filter(ReviewDetail.score >= filters['min_score'])
-                    if filters.get('max_score') is not None:
-                        query = query.filter(ReviewDetail.score <= filters['max_score'])
-                
-                results = query.all()
-                
-                # Convert results to include rework_count as attribute
-                processed_results = []
-                for review_detail, rework_count in results:
-                    review_detail.rework_count = rework_count
-                    processed_results.append(review_detail)
-                
-                # Process aggregation by trainer
-                aggregated = self._process_aggregation_results(processed_results, group_key='human_role_id')
+                # Aggregate pre-delivery rows (is_delivered = 'False') in PostgreSQL
+                aggregated = self._aggregate_pre_delivery(
+                    session, filters, group_key='human_role_id', sort_by=sort_by, limit=limit, offset=offset
+                )
                 
                 # Format for API response
                 for item in aggregated:
                     trainer_id = item.pop('human_role_id', None)
                     item['trainer_id'] = trainer_id
                     contributor_info = contributor_map.get(trainer_id, {})
-                    name = contributor_info.get('name', 'Unknown') if trainer_id else 'Unknown'
-                    status = contributor_info.get('status', None)
-                    item['trainer_name'] = self._format_name_with_status(name, status) if trainer_id else 'Unknown'
-                    item['trainer_email'] = contributor_info.get('email', None) if trainer_id else None
+                    item['trainer_name'] = contributor_info.get('display_name', 'Unknown')
+                    item['trainer_email'] = contributor_info.get('email')
                 
-                # Sort by trainer name
-                aggregated.sort(key=lambda x: x.get('trainer_name', ''))
+                # Without paging options SQL returns groups unordered; sort by trainer name
+                if self._group_page(sort_by, limit, offset) is None:
+                    aggregated.sort(key=lambda x: x.get('trainer_name', ''))
                 
                 return aggregated
         except Exception as e:
             logger.error(f"Error getting trainer aggregation: {e}")
             raise
     
-    def get_reviewer_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """Get reviewer-wise aggregation statistics"""
+    @cached_aggregation()
+    def get_reviewer_aggregation(self, filters: Optional[Dict[str, Any]] = None, sort_by: Optional[str] = None,
+                                 limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        """Get reviewer-wise aggregation statistics (ordered by reviewer name or sort_by, paginated in SQL)"""
         try:
             # Get contributor map for names
             contributor_map = self._get_contributor_map()
             
             with self.db_service.get_session() as session:
-                # Get all review_detail records where is_delivered = 'False' (Pre-Delivery only)
-                # Join with Task to get rework_count
-                query = session.query(ReviewDetail, Task.rework_count).outerjoin(
-                    Task, ReviewDetail.conversation_id == Task.id
-                ).filter(ReviewDetail.is_delivered == 'False')
-                
-                # Apply filters if provided
-                if filters:
-                    if filters.get('domain'):
-                        query = query.filter(ReviewDetail.domain == filters['domain'])
-                    if filters.get('reviewer'):
-                        query = query.filter(ReviewDetail.reviewer_id == int(filters['reviewer']))
-                    if filters.get('trainer'):
-                        query = query.filter(ReviewDetail.human_role_id == int(filters['trainer']))
-                    if filters.get('quality_dimension'):
-                        query = query.filter(ReviewDetail.name == filters['quality_dimension'])
-                    if filters.get('min_score') is not None:
-                        query = query.filter(ReviewDetail.score >= filters['min_score'])
-                    if filters.get('max_score') is not None:
-                        query = query.filter(ReviewDetail.score <= filters['max_score'])
-                
-                results = query.all()
-                
-                # Convert results to include rework_count as attribute
-                processed_results = []
-                for review_detail, rework_count in results:
-                    review_detail.rework_count = rework_count
-                    processed_results.append(review_detail)
-                
-                # Process aggregation by reviewer
-                aggregated = self._process_aggregation_results(processed_results, group_key='reviewer_id')
+                # Aggregate pre-delivery rows (is_delivered = 'False') in PostgreSQL
+                aggregated = self._aggregate_pre_delivery(
+                    session, filters, group_key='reviewer_id', sort_by=sort_by, limit=limit, offset=offset
+                )
                 
                 # Format for API response
                 for item in aggregated:
                     reviewer_id = item.pop('reviewer_id', None)
                     item['reviewer_id'] = reviewer_id
                     contributor_info = contributor_map.get(reviewer_id, {})
-                    name = contributor_info.get('name', 'Unknown') if reviewer_id else 'Unknown'
-                    status = contributor_info.get('status', None)
-                    item['reviewer_name'] = self._format_name_with_status(name, status) if reviewer_id else 'Unknown'
-                    item['reviewer_email'] = contributor_info.get('email', None) if reviewer_id else None
+                    item['reviewer_name'] = contributor_info.get('display_name', 'Unknown')
+                    item['reviewer_email'] = contributor_info.get('email')
                 
-                # Sort by reviewer name
-                aggregated.sort(key=lambda x: x.get('reviewer_name', ''))
+                # Without paging options SQL returns groups unordered; sort by reviewer name
+                if self._group_page(sort_by, limit, offset) is None:
+                    aggregated.sort(key=lambda x: x.get('reviewer_name', ''))
                 
                 return aggregated
         except Exception as e:
@@ -585,402 +1165,303 @@ class PostgresQueryService:
             contributor_map = self._get_contributor_map()
             
             with self.db_service.get_session() as session:
-                # Get all review_detail records where is_delivered = 'False' (Pre-Delivery only)
-                # with colab_link, week_number, and rework_count from task table
-                query = session.query(ReviewDetail, Task.colab_link, Task.week_number, Task.rework_count).outerjoin(
-                    Task, ReviewDetail.conversation_id == Task.id
-                ).filter(ReviewDetail.is_delivered == 'False')
+                # One row per task (conversation_id) from the pre-delivery review_detail rows
+                # (is_delivered = 'False'), with colab_link, week_number, and rework_count from
+                # task table. Quality dimension scores are folded into a jsonb object in SQL
+                quality_dimensions = func.jsonb_object_agg(
+                    ReviewDetail.name,
+                    func.round(cast(ReviewDetail.score, Numeric), 2),
+                    type_=JSONB
+                ).filter(
+                    ReviewDetail.name.isnot(None),
+                    ReviewDetail.score.isnot(None)
+                )
+                stmt = self._build_filtered_review_query(
+                    filters,
+                    ReviewDetail.conversation_id,
+                    func.max(ReviewDetail.task_score).label('task_score'),
+                    func.max(ReviewDetail.human_role_id).label('human_role_id'),
+                    func.max(ReviewDetail.reviewer_id).label('reviewer_id'),
+                    func.max(ReviewDetail.updated_at).label('updated_at'),
+                    func.max(Task.colab_link).label('colab_link'),
+                    func.max(Task.week_number).label('week_number'),
+                    func.max(Task.rework_count).label('rework_count'),
+                    quality_dimensions.label('quality_dimensions')
+                ).where(
+                    ReviewDetail.conversation_id.isnot(None)
+                )
                 
-                # Apply filters if provided
                 if filters:
-                    if filters.get('domain'):
-                        query = query.filter(ReviewDetail.domain == filters['domain'])
-                    if filters.get('reviewer'):
-                        query = query.filter(ReviewDetail.reviewer_id == int(filters['reviewer']))
-                    if filters.get('trainer'):
-                        query = query.filter(ReviewDetail.human_role_id == int(filters['trainer']))
-                    if filters.get('quality_dimension'):
-                        query = query.filter(ReviewDetail.name == filters['quality_dimension'])
-                    if filters.get('min_score') is not None:
-                        query = query.filter(ReviewDetail.score >= filters['min_score'])
-                    if filters.get('max_score') is not None:
-                        query = query.filter(ReviewDetail.score <= filters['max_score'])
                     # Date range filtering
                     if filters.get('date_from'):
-                        from datetime import datetime
                         date_from = filters['date_from']
                         if isinstance(date_from, str):
-                            date_from = datetime.fromisoformat(date_from.replace('Z', '+00:00'))
-                        query = query.filter(ReviewDetail.updated_at >= date_from)
+                            date_from = _parse_iso(date_from)
+                        stmt = stmt.where(ReviewDetail.updated_at >= date_from)
                     if filters.get('date_to'):
-                        from datetime import datetime, timedelta
                         date_to = filters['date_to']
                         if isinstance(date_to, str):
-                            date_to = datetime.fromisoformat(date_to.replace('Z', '+00:00'))
+                            date_to = _parse_iso(date_to)
                         # Include the entire end date
                         date_to = date_to + timedelta(days=1)
-                        query = query.filter(ReviewDetail.updated_at < date_to)
+                        stmt = stmt.where(ReviewDetail.updated_at < date_to)
                 
-                results = query.all()
+                stmt = stmt.group_by(ReviewDetail.conversation_id).order_by(ReviewDetail.conversation_id)
                 
-                # Group by task (conversation_id)
-                task_data = defaultdict(lambda: {
-                    'task_id': None,
-                    'task_score': None,
-                    'annotator_id': None,
-                    'annotator_name': None,
-                    'annotator_email': None,
-                    'reviewer_id': None,
-                    'reviewer_name': None,
-                    'reviewer_email': None,
-                    'colab_link': None,
-                    'updated_at': None,
-                    'week_number': None,
-                    'rework_count': None,
-                    'quality_dimensions': {}
-                })
+                # Stream rows through a server-side cursor instead of materializing the result
+                results = session.execute(stmt.execution_options(yield_per=STREAM_BATCH_SIZE)).mappings()
                 
-                for row, colab_link, week_number, rework_count in results:
-                    task_id = row.conversation_id
-                    if not task_id:
-                        continue
-                    
-                    if task_data[task_id]['task_id'] is None:
-                        task_data[task_id]['task_id'] = task_id
-                        task_data[task_id]['task_score'] = round(float(row.task_score), 2) if row.task_score is not None else None
-                        task_data[task_id]['annotator_id'] = row.human_role_id
-                        
-                        # Get annotator info from contributor map
-                        annotator_info = contributor_map.get(row.human_role_id, {})
-                        annotator_name = annotator_info.get('name', 'Unknown') if row.human_role_id else 'Unknown'
-                        annotator_status = annotator_info.get('status', None)
-                        task_data[task_id]['annotator_name'] = self._format_name_with_status(annotator_name, annotator_status) if row.human_role_id else 'Unknown'
-                        task_data[task_id]['annotator_email'] = annotator_info.get('email', None) if row.human_role_id else None
-                        
-                        task_data[task_id]['reviewer_id'] = row.reviewer_id
-                        
-                        # Get reviewer info from contributor map
-                        reviewer_info = contributor_map.get(row.reviewer_id, {})
-                        reviewer_name = reviewer_info.get('name', 'Unknown') if row.reviewer_id else None
-                        reviewer_status = reviewer_info.get('status', None)
-                        task_data[task_id]['reviewer_name'] = self._format_name_with_status(reviewer_name, reviewer_status) if row.reviewer_id else None
-                        task_data[task_id]['reviewer_email'] = reviewer_info.get('email', None) if row.reviewer_id else None
-                        
-                        task_data[task_id]['colab_link'] = colab_link
-                        task_data[task_id]['updated_at'] = row.updated_at.isoformat() if row.updated_at else None
-                        task_data[task_id]['week_number'] = week_number
-                        task_data[task_id]['rework_count'] = rework_count
+                # Only contributor names are attached in Python
+                result = []
+                for row in results:
+                    annotator_id = row['human_role_id']
+                    reviewer_id = row['reviewer_id']
+                    annotator_info = contributor_map.get(annotator_id, {})
+                    reviewer_info = contributor_map.get(reviewer_id, {})
                     
-                    # Add quality dimension scores
-                    if row.name and row.score is not None:
-                        task_data[task_id]['quality_dimensions'][row.name] = round(float(row.score), 2)
-                
-                # Convert to list
-                result = list(task_data.values())
-                
-                # Sort by task_id
-                result.sort(key=lambda x: x['task_id'])
+                    result.append({
+                        'task_id': row['conversation_id'],
+                        'task_score': round(float(row['task_score']), 2) if row['task_score'] is not None else None,
+                        'annotator_id': annotator_id,
+                        'annotator_name': annotator_info.get('display_name', 'Unknown'),
+                        'annotator_email': annotator_info.get('email'),
+                        'reviewer_id': reviewer_id,
+                        'reviewer_name': reviewer_info.get('display_name', 'Unknown') if reviewer_id else None,
+                        'reviewer_email': reviewer_info.get('email'),
+                        'colab_link': row['colab_link'],
+                        'updated_at': row['updated_at'].isoformat() if row['updated_at'] else None,
+                        'week_number': row['week_number'],
+                        'rework_count': row['rework_count'],
+                        'quality_dimensions': row['quality_dimensions'] or {}
+                    })
                 
                 return result
         except Exception as e:
             logger.error(f"Error getting task level data: {e}")
             raise
     
+    def _get_client_delivery_counts(self, session, filters: Optional[Dict[str, Any]] = None):
+        """
+        Get the scalar counts for the client delivery overall endpoint in a single round trip
+        
+        Args:
+            session: Active database session
+            filters: Optional dashboard filters (only domain applies)
+            
+        Returns:
+            Row with task_count, work_items_count, reviewer_count and quality_dimensions_count
+        """
+        domain = filters.get('domain') if filters else None
+        
+        # Unique reviewer count from review_detail for delivered tasks
+        reviewer_count = select(
+            func.count(func.distinct(ReviewDetail.reviewer_id))
+        ).select_from(WorkItem).join(
+            Task, WorkItem.colab_link == Task.colab_link
+        ).join(
+            ReviewDetail, Task.id == ReviewDetail.conversation_id
+        ).where(
+            Task.is_delivered == 'True'
+        )
+        if domain:
+            reviewer_count = reviewer_count.where(Task.domain == domain)
+        
+        # Distinct allowed quality dimension names from review_detail
+        # Join with work_item to ensure we only count QDs for delivered work items
+        quality_dimensions_count = select(
+            func.count(func.distinct(ReviewDetail.name))
+        ).select_from(ReviewDetail).join(
+            Task, ReviewDetail.conversation_id == Task.id
+        ).join(
+            WorkItem, Task.colab_link == WorkItem.colab_link
+        ).where(
+            ReviewDetail.is_delivered == 'True',
+            ReviewDetail.name.in_(self._get_allowed_quality_dimensions())
+        )
+        if domain:
+            quality_dimensions_count = quality_dimensions_count.where(ReviewDetail.domain == domain)
+        
+        return session.execute(
+            select(
+                _WORK_ITEM_TASK_COUNT,
+                _WORK_ITEM_COUNT,
+                reviewer_count.scalar_subquery().label('reviewer_count'),
+                quality_dimensions_count.scalar_subquery().label('quality_dimensions_count')
+            )
+        ).one()
+    
+    def _get_client_delivery_task_stats(self, session, filters: Optional[Dict[str, Any]] = None):
+        """
+        Get rework, trainer and domain statistics over the distinct delivered work_item task_ids
+        
+        Args:
+            session: Active database session
+            filters: Optional dashboard filters (only domain applies)
+            
+        Returns:
+            Row with task_rows, domain_count, trainer_count, total_rework_count and average_rework_count
+        """
+        # For other stats, we need to join with Task table
+        # Get distinct work_item task_ids with domain, trainer info, and rework_count
+        task_query = select(
+            WorkItem.task_id,
+            Task.domain,
+            Task.current_user_id,
+            Task.rework_count
+        ).select_from(WorkItem).join(
+            Task, WorkItem.colab_link == Task.colab_link
+        ).where(
+            Task.is_delivered == 'True'
+        ).distinct(WorkItem.task_id)
+        
+        # Apply filters if provided
+        if filters:
+            if filters.get('domain'):
+                task_query = task_query.where(Task.domain == filters['domain'])
+        
+        # Statistics over the distinct work_item task_ids, computed in SQL
+        tasks = task_query.subquery()
+        return session.execute(
+            select(
+                func.count().label('task_rows'),
+                func.count(func.distinct(func.nullif(tasks.c.domain, ''))).label('domain_count'),
+                func.count(func.distinct(tasks.c.current_user_id)).label('trainer_count'),
+                func.sum(tasks.c.rework_count).label('total_rework_count'),
+                func.avg(tasks.c.rework_count).label('average_rework_count')
+            )
+        ).one()
+    
     def get_client_delivery_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get overall aggregation statistics for client delivery (delivered tasks only)
         Count directly from WorkItem table to include ALL delivered work items"""
         try:
-            with self.db_service.get_session() as session:
-                from app.models.db_models import TaskReviewedInfo
-                
-                # Count distinct task_ids directly from WorkItem (no JOIN with Task)
-                # This ensures we count ALL delivered work items
-                task_count = session.query(
-                    func.count(func.distinct(WorkItem.task_id))
-                ).filter(
-                    WorkItem.task_id.isnot(None)
-                ).scalar() or 0
-                
-                # Count distinct work_item_ids
-                work_items_count = session.query(
-                    func.count(func.distinct(WorkItem.work_item_id))
-                ).scalar() or 0
-                
-                # For other stats, we need to join with Task table
-                # Get distinct work_item task_ids with domain, trainer info, and rework_count
-                task_query = session.query(
-                    WorkItem.task_id,
-                    Task.domain,
-                    Task.current_user_id,
-                    TaskReviewedInfo.task_score,
-                    Task.rework_count
-                ).select_from(WorkItem).join(
-                    Task, WorkItem.colab_link == Task.colab_link
-                ).outerjoin(
-                    TaskReviewedInfo, Task.id == TaskReviewedInfo.r_id
-                ).filter(
-                    Task.is_delivered == 'True'
-                ).distinct(WorkItem.task_id)
-                
-                # Apply filters if provided
-                if filters:
-                    if filters.get('domain'):
-                        task_query = task_query.filter(Task.domain == filters['domain'])
-                
-                task_results = task_query.all()
-                
-                if not task_results:
-                    return {
-                        'task_count': task_count,
-                        'work_items_count': work_items_count,
-                        'reviewer_count': 0,
-                        'trainer_count': 0,
-                        'domain_count': 0,
-                        'quality_dimensions_count': 0
-                    }
-                
-                # Get unique reviewer count from review_detail
-                reviewer_query = session.query(
-                    func.count(func.distinct(ReviewDetail.reviewer_id))
-                ).select_from(WorkItem).join(
-                    Task, WorkItem.colab_link == Task.colab_link
-                ).join(
-                    ReviewDetail, Task.id == ReviewDetail.conversation_id
-                ).filter(
-                    Task.is_delivered == 'True'
-                )
-                
-                if filters and filters.get('domain'):
-                    reviewer_query = reviewer_query.filter(Task.domain == filters['domain'])
-                
-                reviewer_count = reviewer_query.scalar() or 0
-                
-                # Calculate statistics based on distinct work_item task_ids
-                unique_domains = set()
-                unique_trainers = set()
-                task_scores = []
-                rework_counts = []
-                
-                for row in task_results:
-                    if row.domain:
-                        unique_domains.add(row.domain)
-                    if row.current_user_id:
-                        unique_trainers.add(row.current_user_id)
-                    if row.task_score is not None:
-                        task_scores.append(float(row.task_score))
-                    if row.rework_count is not None:
-                        rework_counts.append(int(row.rework_count))
-                
-                avg_score = sum(task_scores) / len(task_scores) if task_scores else 0
-                total_rework_count = sum(rework_counts) if rework_counts else 0
-                average_rework_count = round(sum(rework_counts) / len(rework_counts), 2) if rework_counts else 0
-                
-                # Get quality dimensions count from review_detail
-                # Join with work_item to ensure we only count QDs for delivered work items
-                qd_query = session.query(
-                    ReviewDetail.name
-                ).select_from(ReviewDetail).join(
-                    Task, ReviewDetail.conversation_id == Task.id
-                ).join(
-                    WorkItem, Task.colab_link == WorkItem.colab_link
-                ).filter(
-                    ReviewDetail.is_delivered == 'True'
-                ).distinct()
-                
-                if filters and filters.get('domain'):
-                    qd_query = qd_query.filter(ReviewDetail.domain == filters['domain'])
-                
-                # Get distinct names and count them (filtered by allowed dimensions)
-                distinct_qd_names = qd_query.all()
-                allowed_dimensions = self._get_allowed_quality_dimensions()
-                # Filter to only count allowed quality dimensions
-                filtered_qd_names = [row.name for row in distinct_qd_names if row.name in allowed_dimensions]
-                quality_dimensions_count = len(filtered_qd_names)
-                
+            # The scalar counts and the task statistics are independent, so run
+            # them concurrently on separate pooled connections
+            counts_future = _query_executor.submit(
+                self._run_in_session, self._get_client_delivery_counts, filters
+            )
+            task_stats_future = _query_executor.submit(
+                self._run_in_session, self._get_client_delivery_task_stats, filters
+            )
+            counts = counts_future.result()
+            task_stats = task_stats_future.result()
+            
+            task_count = counts.task_count or 0
+            work_items_count = counts.work_items_count or 0
+            
+            if not task_stats.task_rows:
                 return {
-                    'task_count': task_count,  # Count of distinct work_item.task_id (from WorkItem table directly)
-                    'work_items_count': work_items_count,  # Count of distinct work_item_id
-                    'reviewer_count': reviewer_count,
-                    'trainer_count': len(unique_trainers),
-                    'domain_count': len(unique_domains),
-                    'quality_dimensions_count': quality_dimensions_count,
-                    'total_rework_count': total_rework_count,
-                    'average_rework_count': average_rework_count
+                    'task_count': task_count,
+                    'work_items_count': work_items_count,
+                    'reviewer_count': 0,
+                    'trainer_count': 0,
+                    'domain_count': 0,
+                    'quality_dimensions_count': 0
                 }
+            
+            reviewer_count = counts.reviewer_count or 0
+            
+            total_rework_count = int(task_stats.total_rework_count or 0)
+            average_rework_count = (
+                round(float(task_stats.average_rework_count), 2)
+                if task_stats.average_rework_count is not None else 0
+            )
+            
+            return {
+                'task_count': task_count,  # Count of distinct work_item.task_id (from WorkItem table directly)
+                'work_items_count': work_items_count,  # Count of distinct work_item_id
+                'reviewer_count': reviewer_count,
+                'trainer_count': task_stats.trainer_count,
+                'domain_count': task_stats.domain_count,
+                'quality_dimensions_count': counts.quality_dimensions_count or 0,
+                'total_rework_count': total_rework_count,
+                'average_rework_count': average_rework_count
+            }
         except Exception as e:
             logger.error(f"Error getting client delivery aggregation: {e}")
             raise
     
-    def get_client_delivery_domain_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """Get domain-wise aggregation for client delivery (delivered tasks only)
-        Task count based on distinct work_item.task_id"""
+    @cached_aggregation()
+    def get_client_delivery_all_aggregations(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the domain, trainer and reviewer aggregations for client delivery (delivered tasks only)
+        from a single GROUPING SETS query, or from mv_client_delivery_agg when unfiltered.
+        Cached, so the three per-grouping endpoints loaded together by the dashboard share
+        one database pass
+        
+        Args:
+            filters: Optional dashboard filters
+            
+        Returns:
+            Dict with 'domain', 'trainer' and 'reviewer' aggregation lists
+        """
         try:
             with self.db_service.get_session() as session:
-                # Get review_detail joined with work_item to get task_id and rework_count
-                query = session.query(
-                    ReviewDetail.domain,
-                    ReviewDetail.name,
-                    ReviewDetail.score,
-                    ReviewDetail.task_score,
-                    WorkItem.task_id,
-                    Task.rework_count
-                ).select_from(ReviewDetail).join(
-                    Task, ReviewDetail.conversation_id == Task.id
-                ).join(
-                    WorkItem, Task.colab_link == WorkItem.colab_link
-                ).filter(
-                    ReviewDetail.is_delivered == 'True'
-                )
-                
-                # Apply filters if provided
-                if filters:
-                    if filters.get('domain'):
-                        query = query.filter(ReviewDetail.domain == filters['domain'])
-                    if filters.get('reviewer'):
-                        query = query.filter(ReviewDetail.reviewer_id == int(filters['reviewer']))
-                    if filters.get('trainer'):
-                        query = query.filter(ReviewDetail.human_role_id == int(filters['trainer']))
-                    if filters.get('quality_dimension'):
-                        query = query.filter(ReviewDetail.name == filters['quality_dimension'])
-                    if filters.get('min_score') is not None:
-                        query = query.filter(ReviewDetail.score >= filters['min_score'])
-                    if filters.get('max_score') is not None:
-                        query = query.filter(ReviewDetail.score <= filters['max_score'])
-                
-                results = query.all()
-                
-                # Process aggregation by domain with work_item task_id
-                aggregated = self._process_client_delivery_aggregation(results, group_key='domain')
+                # Unfiltered requests are served from the materialized view when it is current
+                view_rows = None
+                if not self._has_review_filters(filters):
+                    view_rows = self._read_client_delivery_agg_view(session, self._get_allowed_quality_dimensions())
+                if view_rows is not None:
+                    dimension_rows, group_rows = view_rows
+                else:
+                    dimension_rows, group_rows = self._query_client_delivery_stats(session, filters)
+            
+            group_stats = {(row.grain, row._mapping[row.grain]): row for row in group_rows}
+            
+            # Collect quality dimensions per (grain, group value)
+            dimensions_by_group = defaultdict(list)
+            for row in dimension_rows:
+                dimensions_by_group[(row.grain, row._mapping[row.grain])].append(self._format_dimension_row(row))
+            
+            result = {'domain': [], 'trainer': [], 'reviewer': []}
+            for (grain, group_value), quality_dimensions in dimensions_by_group.items():
+                # Sort by name for consistency
+                quality_dimensions.sort(key=lambda x: x['name'])
                 
-                # Add domain key to each item
-                for item in aggregated:
-                    domain = item.get('domain', 'Unknown')
-                    item['domain'] = domain if domain else 'Unknown'
+                stats = group_stats.get((grain, group_value))
+                item = self._format_group_stats(stats)
+                item['quality_dimensions'] = quality_dimensions
                 
-                return aggregated
+                # Format for API response
+                if grain == 'domain':
+                    item['domain'] = group_value if group_value else 'Unknown'
+                    result['domain'].append(item)
+                    continue
+                
+                display_name = self._format_name_with_status(
+                    stats.contributor_name, stats.contributor_status
+                ) if stats else 'Unknown'
+                email = stats.contributor_email if stats else None
+                if grain == 'human_role_id':
+                    item['trainer_id'] = group_value
+                    item['trainer_name'] = display_name
+                    item['trainer_email'] = email
+                    result['trainer'].append(item)
+                else:
+                    item['reviewer_id'] = group_value
+                    item['reviewer_name'] = display_name
+                    item['reviewer_email'] = email
+                    result['reviewer'].append(item)
+            
+            return result
         except Exception as e:
-            logger.error(f"Error getting client delivery domain aggregation: {e}")
+            logger.error(f"Error getting client delivery aggregations: {e}")
             raise
     
+    def get_client_delivery_domain_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Get domain-wise aggregation for client delivery (delivered tasks only)
+        Task count based on distinct work_item.task_id"""
+        return self.get_client_delivery_all_aggregations(filters)['domain']
+    
     def get_client_delivery_trainer_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get trainer-wise aggregation for client delivery (delivered tasks only)
         Task count based on distinct work_item.task_id"""
-        try:
-            contributor_map = self._get_contributor_map()
-            
-            with self.db_service.get_session() as session:
-                # Get review_detail joined with work_item to get task_id and rework_count
-                query = session.query(
-                    ReviewDetail.human_role_id,
-                    ReviewDetail.name,
-                    ReviewDetail.score,
-                    ReviewDetail.task_score,
-                    WorkItem.task_id,
-                    Task.rework_count
-                ).select_from(ReviewDetail).join(
-                    Task, ReviewDetail.conversation_id == Task.id
-                ).join(
-                    WorkItem, Task.colab_link == WorkItem.colab_link
-                ).filter(
-                    ReviewDetail.is_delivered == 'True'
-                )
-                
-                # Apply filters if provided
-                if filters:
-                    if filters.get('domain'):
-                        query = query.filter(ReviewDetail.domain == filters['domain'])
-                    if filters.get('reviewer'):
-                        query = query.filter(ReviewDetail.reviewer_id == int(filters['reviewer']))
-                    if filters.get('trainer'):
-                        query = query.filter(ReviewDetail.human_role_id == int(filters['trainer']))
-                    if filters.get('quality_dimension'):
-                        query = query.filter(ReviewDetail.name == filters['quality_dimension'])
-                    if filters.get('min_score') is not None:
-                        query = query.filter(ReviewDetail.score >= filters['min_score'])
-                    if filters.get('max_score') is not None:
-                        query = query.filter(ReviewDetail.score <= filters['max_score'])
-                
-                results = query.all()
-                
-                # Process aggregation by trainer with work_item task_id
-                aggregated = self._process_client_delivery_aggregation(results, group_key='human_role_id')
-                
-                # Format for API response
-                for item in aggregated:
-                    trainer_id = item.get('human_role_id')
-                    contributor_info = contributor_map.get(trainer_id, {})
-                    name = contributor_info.get('name', 'Unknown') if trainer_id else 'Unknown'
-                    status = contributor_info.get('status', None)
-                    email = contributor_info.get('email', None) if trainer_id else None
-                    
-                    item['trainer_id'] = trainer_id
-                    item['trainer_name'] = self._format_name_with_status(name, status) if trainer_id else 'Unknown'
-                    item['trainer_email'] = email
-                    del item['human_role_id']
-                
-                return aggregated
-        except Exception as e:
-            logger.error(f"Error getting client delivery trainer aggregation: {e}")
-            raise
+        return self.get_client_delivery_all_aggregations(filters)['trainer']
     
     def get_client_delivery_reviewer_aggregation(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get reviewer-wise aggregation for client delivery (delivered tasks only)
         Task count based on distinct work_item.task_id"""
-        try:
-            contributor_map = self._get_contributor_map()
-            
-            with self.db_service.get_session() as session:
-                # Get review_detail joined with work_item to get task_id and rework_count
-                query = session.query(
-                    ReviewDetail.reviewer_id,
-                    ReviewDetail.name,
-                    ReviewDetail.score,
-                    ReviewDetail.task_score,
-                    WorkItem.task_id,
-                    Task.rework_count
-                ).select_from(ReviewDetail).join(
-                    Task, ReviewDetail.conversation_id == Task.id
-                ).join(
-                    WorkItem, Task.colab_link == WorkItem.colab_link
-                ).filter(
-                    ReviewDetail.is_delivered == 'True'
-                )
-                
-                # Apply filters if provided
-                if filters:
-                    if filters.get('domain'):
-                        query = query.filter(ReviewDetail.domain == filters['domain'])
-                    if filters.get('reviewer'):
-                        query = query.filter(ReviewDetail.reviewer_id == int(filters['reviewer']))
-                    if filters.get('trainer'):
-                        query = query.filter(ReviewDetail.human_role_id == int(filters['trainer']))
-                    if filters.get('quality_dimension'):
-                        query = query.filter(ReviewDetail.name == filters['quality_dimension'])
-                    if filters.get('min_score') is not None:
-                        query = query.filter(ReviewDetail.score >= filters['min_score'])
-                    if filters.get('max_score') is not None:
-                        query = query.filter(ReviewDetail.score <= filters['max_score'])
-                
-                results = query.all()
-                
-                # Process aggregation by reviewer with work_item task_id
-                aggregated = self._process_client_delivery_aggregation(results, group_key='reviewer_id')
-                
-                # Format for API response
-                for item in aggregated:
-                    reviewer_id = item.get('reviewer_id')
-                    contributor_info = contributor_map.get(reviewer_id, {})
-                    name = contributor_info.get('name', 'Unknown') if reviewer_id else 'Unknown'
-                    status = contributor_info.get('status', None)
-                    email = contributor_info.get('email', None) if reviewer_id else None
-                    
-                    item['reviewer_name'] = self._format_name_with_status(name, status) if reviewer_id else 'Unknown'
-                    item['reviewer_email'] = email
-                
-                return aggregated
-        except Exception as e:
-            logger.error(f"Error getting client delivery reviewer aggregation: {e}")
-            raise
+        return self.get_client_delivery_all_aggregations(filters)['reviewer']
     
     def get_delivery_tracker(self) -> List[Dict[str, Any]]:
         """
@@ -990,23 +1471,12 @@ class PostgresQueryService:
         try:
             with self.db_service.get_session() as session:
                 # Query work_item table grouped by delivery_date
-                results = session.query(
-                    func.date(WorkItem.delivery_date).label('delivery_date'),
-                    func.count(WorkItem.task_id).label('total_tasks'),
-                    func.array_agg(func.distinct(WorkItem.json_filename)).label('file_names')
-                ).filter(
-                    WorkItem.delivery_date.isnot(None)
-                ).group_by(
-                    func.date(WorkItem.delivery_date)
-                ).order_by(
-                    func.date(WorkItem.delivery_date).desc()
-                ).all()
+                results = session.execute(_DELIVERY_TRACKER_STMT).all()
                 
                 # Format results
                 tracker_data = []
                 for row in results:
-                    # Filter out None values from file_names array
-                    file_names = [f for f in (row.file_names or []) if f is not None]
+                    file_names = row.file_names or []
                     
                     tracker_data.append({
                         'delivery_date': row.delivery_date.strftime('%Y-%m-%d') if row.delivery_date else None,
@@ -1027,88 +1497,83 @@ class PostgresQueryService:
         """
         try:
             with self.db_service.get_session() as session:
-                from sqlalchemy import func
+                # One task_score per conversation, so joining review_detail doesn't
+                # multiply work item rows and no DISTINCT pass is needed
+                rd_agg = select(
+                    ReviewDetail.conversation_id,
+                    func.max(ReviewDetail.task_score).label('task_score')
+                ).group_by(ReviewDetail.conversation_id).subquery()
                 
                 # Get all work items with their task details
                 # Note: Shows ALL work items regardless of task delivery status
-                results = session.query(
+                stmt = select(
                     WorkItem.work_item_id,
                     WorkItem.task_id.label('workitem_task_id'),  # Original task_id from work_item
                     WorkItem.delivery_date,
                     Task.id.label('labelling_task_id'),  # Task.id is the conversation/task ID
                     WorkItem.json_filename,
-                    ReviewDetail.task_score,
+                    rd_agg.c.task_score,
                     Task.rework_count,
                     WorkItem.turing_status,
                     WorkItem.client_status,
                     WorkItem.task_level_feedback,
                     WorkItem.error_categories
-                ).outerjoin(
+                ).select_from(WorkItem).outerjoin(
                     Task,
                     WorkItem.colab_link == Task.colab_link
                 ).outerjoin(
-                    ReviewDetail,
-                    Task.id == ReviewDetail.conversation_id
-                ).distinct().all()
+                    rd_agg,
+                    Task.id == rd_agg.c.conversation_id
+                ).order_by(
+                    # Latest delivery first within each task, compared as timestamps
+                    Task.id, WorkItem.delivery_date.desc().nulls_last()
+                )
+                
+                # Stream rows through a server-side cursor as mappings keyed by column label
+                results = session.execute(stmt.execution_options(yield_per=STREAM_BATCH_SIZE)).mappings()
 
-                # Group by labelling_task_id (use work_item_id as fallback if no task match)
+                # Group by labelling_task_id (use work_item_id as fallback if no task match),
+                # building each task's response in a single pass
                 task_groups = {}
                 for row in results:
                     # Use labelling_task_id if available, otherwise use work_item_id as unique identifier
-                    labelling_task_id = row.labelling_task_id if row.labelling_task_id else f"wi_{row.work_item_id}"
+                    labelling_task_id = row['labelling_task_id'] if row['labelling_task_id'] else f"wi_{row['work_item_id']}"
+                    delivery_date = row['delivery_date'].strftime('%Y-%m-%d') if row['delivery_date'] else None
+                    client_status = row['client_status'] or 'Pending'
                     
-                    if labelling_task_id not in task_groups:
-                        task_groups[labelling_task_id] = {
-                            'task_id': row.labelling_task_id if row.labelling_task_id else row.workitem_task_id or row.work_item_id,  # Use best available ID
-                            'task_score': float(row.task_score) if row.task_score is not None else None,
-                            'rework_count': int(row.rework_count) if row.rework_count is not None else 0,
-                            'work_items': []
+                    task_info = task_groups.get(labelling_task_id)
+                    if task_info is None:
+                        # Rows are ordered by delivery_date DESC NULLS LAST within each task, so the
+                        # first row is the most recent delivery and carries the task's client_status
+                        task_info = task_groups[labelling_task_id] = {
+                            'task_id': row['labelling_task_id'] if row['labelling_task_id'] else row['workitem_task_id'] or row['work_item_id'],  # Use best available ID
+                            'task_score': float(row['task_score']) if row['task_score'] is not None else None,
+                            'rework_count': int(row['rework_count']) if row['rework_count'] is not None else 0,
+                            'delivery_date': delivery_date,
+                            'work_item_count': 0,
+                            'turing_status': 'Delivered',
+                            'client_status': client_status if delivery_date else 'Pending',
+                            'work_items': []  # All work items for this task
                         }
                     
+                    # Overall turing_status is Rework if any work item is in Rework
+                    if row['turing_status'] == 'Rework':
+                        task_info['turing_status'] = 'Rework'
+                    task_info['work_item_count'] += 1
+                    
                     # Add work item to this task's list
-                    task_groups[labelling_task_id]['work_items'].append({
-                        'work_item_id': row.work_item_id,
-                        'task_id': row.workitem_task_id,  # Original task_id from work_item table
-                        'delivery_date': row.delivery_date.strftime('%Y-%m-%d') if row.delivery_date else None,
-                        'json_filename': row.json_filename,
-                        'turing_status': row.turing_status,
-                        'client_status': row.client_status or 'Pending',
-                        'task_level_feedback': row.task_level_feedback,
-                        'error_categories': row.error_categories
+                    task_info['work_items'].append({
+                        'work_item_id': row['work_item_id'],
+                        'task_id': row['workitem_task_id'],  # Original task_id from work_item table
+                        'delivery_date': delivery_date,
+                        'json_filename': row['json_filename'],
+                        'turing_status': row['turing_status'],
+                        'client_status': client_status,
+                        'task_level_feedback': row['task_level_feedback'],
+                        'error_categories': row['error_categories']
                     })
                 
-                # Calculate aggregated status for each task
-                task_data = []
-                for task_id, task_info in task_groups.items():
-                    work_items = task_info['work_items']
-                    
-                    # Determine overall turing_status (if any is Rework, show Rework)
-                    turing_statuses = [wi['turing_status'] for wi in work_items]
-                    overall_turing_status = 'Rework' if 'Rework' in turing_statuses else 'Delivered'
-                    
-                    # Get most recent delivery date and its client_status
-                    work_items_with_dates = [wi for wi in work_items if wi['delivery_date']]
-                    if work_items_with_dates:
-                        # Sort by delivery_date to get the latest
-                        latest_work_item = max(work_items_with_dates, key=lambda x: x['delivery_date'])
-                        latest_delivery_date = latest_work_item['delivery_date']
-                        overall_client_status = latest_work_item['client_status']
-                    else:
-                        latest_delivery_date = None
-                        overall_client_status = 'Pending'
-                    
-                    task_data.append({
-                        'task_id': task_info['task_id'],  # Use the actual task_id from task_info
-                        'task_score': task_info['task_score'],
-                        'rework_count': task_info['rework_count'],
-                        'delivery_date': latest_delivery_date,
-                        'work_item_count': len(work_items),
-                        'turing_status': overall_turing_status,
-                        'client_status': overall_client_status,
-                        'work_items': work_items  # All work items for this task
-                    })
-
-                return task_data
+                return list(task_groups.values())
         except Exception as e:
             logger.error(f"Error getting client delivery task-wise data: {e}")
             raise
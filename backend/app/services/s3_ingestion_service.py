@@ -2,22 +2,120 @@
 S3 Ingestion Service for Work Items
 Reads JSON files from S3 and ingests work items into PostgreSQL
 """
-import json
+import io
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
+from datetime import datetime, timezone
 import boto3
+import orjson
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, func, select, text, update, or_, cast
+from sqlalchemy.types import TIMESTAMP
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.dialects.postgresql import insert
 
 from app.config import get_settings
 from app.models.db_models import WorkItem, DataSyncLog
+from app.services.db_service import get_db_service
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# A cached S3 client is replaced after this long, or earlier if its assumed-role token expires sooner
+S3_CLIENT_MAX_AGE_SECONDS = 55 * 60
+
+# Assumed-role credentials are refreshed this long before they expire
+STS_REFRESH_MARGIN_SECONDS = 5 * 60
+
+# Keys per ListObjectsV2 response (the S3 maximum)
+S3_LIST_PAGE_SIZE = 1000
+
+# Folders listed concurrently during ingestion
+S3_LIST_MAX_WORKERS = 8
+
+# Prefix of the colab_link generated for each work item's task
+COLAB_LINK_PREFIX = "https://rlhf-v3.turing.com/prompt/"
+
+
+def _build_work_item_upsert():
+    """INSERT ... ON CONFLICT (work_item_id) DO UPDATE for work items, executed with a list of row dicts"""
+    stmt = insert(WorkItem)
+    return stmt.on_conflict_do_update(
+        index_elements=['work_item_id'],
+        set_={
+            'task_id': stmt.excluded.task_id,
+            'annotator_id': stmt.excluded.annotator_id,
+            'colab_link': stmt.excluded.colab_link,
+            'ingestion_date': stmt.excluded.ingestion_date,
+            'delivery_date': stmt.excluded.delivery_date,
+            'json_filename': stmt.excluded.json_filename,
+        },
+        # An older delivery never replaces a newer one, whatever order files are (re)ingested in
+        where=or_(WorkItem.delivery_date.is_(None), WorkItem.delivery_date <= stmt.excluded.delivery_date)
+    )
+
+
+# Built once; the rows are bound as executemany parameters, which SQLAlchemy
+# sends as multi-row VALUES pages (insertmanyvalues) instead of compiling a
+# statement with literal VALUES per batch
+_WORK_ITEM_UPSERT = _build_work_item_upsert()
+
+# Upserts of at least this many rows are loaded with COPY into a staging table instead
+COPY_UPSERT_THRESHOLD = 5000
+
+# Columns filled from the S3 JSON; the rest of work_item keeps its insert defaults
+_COPY_COLUMNS = (
+    'work_item_id', 'task_id', 'annotator_id', 'colab_link',
+    'ingestion_date', 'delivery_date', 'json_filename',
+)
+
+_COPY_COLUMN_LIST = ', '.join(_COPY_COLUMNS)
+
+# Same column types as work_item, without its constraints, dropped at commit.
+# delivery_date is staged as timestamptz so offsets in S3's aware timestamps are
+# converted the same way psycopg2 binds them, rather than dropped by COPY
+_CREATE_WORK_ITEM_STAGE = text(
+    f"CREATE TEMP TABLE work_item_stage ON COMMIT DROP AS "
+    f"SELECT {_COPY_COLUMN_LIST.replace('delivery_date', 'delivery_date::timestamptz AS delivery_date')} "
+    f"FROM work_item WITH NO DATA"
+)
+
+_COPY_WORK_ITEM_STAGE = f"COPY work_item_stage ({_COPY_COLUMN_LIST}) FROM STDIN"
+
+_DROP_WORK_ITEM_STAGE = text("DROP TABLE work_item_stage")
+
+# created_at/turing_status/client_status only have Python-side defaults on the
+# model, so they are bound explicitly for new rows
+_UPSERT_FROM_WORK_ITEM_STAGE = text(
+    f"INSERT INTO work_item ({_COPY_COLUMN_LIST}, created_at, turing_status, client_status) "
+    f"SELECT {_COPY_COLUMN_LIST}, :created_at, :turing_status, :client_status FROM work_item_stage "
+    f"ON CONFLICT (work_item_id) DO UPDATE SET "
+    + ', '.join(f"{column} = EXCLUDED.{column}" for column in _COPY_COLUMNS[1:])
+    + " WHERE work_item.delivery_date IS NULL OR work_item.delivery_date <= EXCLUDED.delivery_date"
+)
+
+
+def _copy_text_value(value: Any) -> str:
+    """Render a value for COPY's text format (\\N is NULL; backslash and control characters are escaped)"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, datetime):
+        return value.isoformat(sep=' ')
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
 
 class S3IngestionService:
     """Service to ingest work items from S3 JSON files"""
@@ -25,8 +123,11 @@ class S3IngestionService:
     def __init__(self):
         self.settings = get_settings()
         
-        # Store credentials info but don't create S3 client yet (to avoid expired tokens)
-        self.s3_client = None
+        # S3 client is created on first use and replaced before its credentials expire
+        self._s3_client = None
+        self._s3_client_expires_at = 0.0
+        # Download workers share the client, so only one of them refreshes it
+        self._s3_client_lock = threading.Lock()
         
         # Get S3 bucket and prefix from settings
         self.s3_bucket = self.settings.s3_bucket
@@ -34,18 +135,33 @@ class S3IngestionService:
         
         logger.info(f"S3 Configuration: s3://{self.s3_bucket}/{self.s3_prefix}")
         
-        # Initialize database connection
-        db_url = (
-            f"postgresql://{self.settings.postgres_user}:{self.settings.postgres_password}@"
-            f"{self.settings.postgres_host}:{self.settings.postgres_port}/{self.settings.postgres_db}"
+        # Initialize database connection, with the same URL as the main database service
+        self.engine = create_engine(
+            get_db_service().get_connection_url(),
+            # Ingestion writes from one thread, so a small pool is enough; it
+            # counts toward db_max_connections alongside the main pool
+            pool_size=self.settings.s3_db_pool_size,
+            max_overflow=self.settings.s3_db_max_overflow,
+            pool_recycle=self.settings.db_pool_recycle,
+            pool_pre_ping=self.settings.db_pool_pre_ping,
+            # psycopg2 fast execution helpers: multi-row VALUES for INSERT
+            # executemany, execute_batch for UPDATE/DELETE executemany
+            executemany_mode='values_plus_batch',
+            insertmanyvalues_page_size=self.settings.s3_ingest_batch_size,
+            executemany_batch_page_size=500
         )
-        self.engine = create_engine(db_url, pool_pre_ping=True)
         self.SessionLocal = sessionmaker(bind=self.engine)
     
-    def _get_s3_client(self):
+    def _create_s3_client(self) -> Tuple[Any, float]:
         """
-        Get a fresh S3 client with current credentials (refreshes expired tokens)
+        Create an S3 client with current credentials
+        The client is thread-safe and its connection pool is sized for the
+        download and folder listing workers
+        Returns:
+            Tuple of (client, seconds the client may be reused for)
         """
+        client_config = Config(max_pool_connections=self.settings.s3_max_workers + S3_LIST_MAX_WORKERS)
+        
         # Use credentials from settings if available, otherwise use profile
         if self.settings.aws_access_key_id and self.settings.aws_secret_access_key:
             # Use credentials from settings (.env file)
@@ -64,19 +180,35 @@ class S3IngestionService:
                     DurationSeconds=3600  # 1 hour
                 )
                 credentials = assumed_role['Credentials']
-                return boto3.client(
+                client = boto3.client(
                     's3',
                     aws_access_key_id=credentials['AccessKeyId'],
                     aws_secret_access_key=credentials['SecretAccessKey'],
                     aws_session_token=credentials['SessionToken'],
-                    region_name=self.settings.aws_region or 'us-east-1'
+                    region_name=self.settings.aws_region or 'us-east-1',
+                    config=client_config
                 )
+                # The assumed-role token must not expire while the client is cached
+                token_seconds = (credentials['Expiration'] - datetime.now(timezone.utc)).total_seconds()
+                return client, min(S3_CLIENT_MAX_AGE_SECONDS, token_seconds - STS_REFRESH_MARGIN_SECONDS)
             else:
-                return session.client('s3')
+                return session.client('s3', config=client_config), S3_CLIENT_MAX_AGE_SECONDS
         else:
             # Fall back to AWS profile
             session = boto3.Session(profile_name=self.settings.s3_aws_profile)
-            return session.client('s3')
+            return session.client('s3', config=client_config), S3_CLIENT_MAX_AGE_SECONDS
+    
+    def _get_s3_client(self):
+        """
+        Get the cached S3 client, creating a new one (and refreshing the assumed
+        role) only once the cached client has expired
+        """
+        with self._s3_client_lock:
+            if self._s3_client is None or time.monotonic() >= self._s3_client_expires_at:
+                client, max_age_seconds = self._create_s3_client()
+                self._s3_client = client
+                self._s3_client_expires_at = time.monotonic() + max_age_seconds
+            return self._s3_client
     
     def list_s3_folders(self) -> List[str]:
         """
@@ -90,7 +222,12 @@ class S3IngestionService:
             paginator = s3_client.get_paginator('list_objects_v2')
             folders = set()
             
-            for page in paginator.paginate(Bucket=self.s3_bucket, Prefix=self.s3_prefix, Delimiter='/'):
+            for page in paginator.paginate(
+                Bucket=self.s3_bucket,
+                Prefix=self.s3_prefix,
+                Delimiter='/',
+                PaginationConfig={'PageSize': S3_LIST_PAGE_SIZE}
+            ):
                 if 'CommonPrefixes' in page:
                     for prefix in page['CommonPrefixes']:
                         folder_path = prefix['Prefix']
@@ -122,15 +259,20 @@ class S3IngestionService:
             paginator = s3_client.get_paginator('list_objects_v2')
             json_files = []
             
-            for page in paginator.paginate(Bucket=self.s3_bucket, Prefix=folder_prefix):
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        key = obj['Key']
-                        if key.endswith('.json'):
-                            json_files.append({
-                                'key': key,
-                                'last_modified': obj['LastModified']  # This is the upload date
-                            })
+            for page in paginator.paginate(
+                Bucket=self.s3_bucket,
+                Prefix=folder_prefix,
+                PaginationConfig={'PageSize': S3_LIST_PAGE_SIZE}
+            ):
+                # S3 cannot filter by suffix, so non-JSON keys (.crc, manifests) are dropped here
+                json_files.extend(
+                    {
+                        'key': obj['Key'],
+                        'last_modified': obj['LastModified']  # This is the upload date
+                    }
+                    for obj in page.get('Contents', ())
+                    if obj['Key'][-5:] == '.json'
+                )
             
             logger.info(f"Found {len(json_files)} JSON files in folder {folder_name}")
             return json_files
@@ -139,88 +281,203 @@ class S3IngestionService:
             logger.error(f"Error listing JSON files in folder {folder_name}: {e}")
             return []
     
-    def read_json_from_s3(self, s3_key: str) -> Optional[Dict[str, Any]]:
+    def read_json_from_s3(self, s3_key: str, s3_client=None) -> Optional[Dict[str, Any]]:
         """
         Read and parse a JSON file from S3
         Args:
             s3_key: Full S3 key path to the JSON file
+            s3_client: Optional S3 client to reuse (a new one is created otherwise)
         Returns:
             Parsed JSON content as dictionary
         """
         try:
-            logger.info(f"Reading s3://{self.s3_bucket}/{s3_key}")
+            logger.debug(f"Reading s3://{self.s3_bucket}/{s3_key}")
             
-            s3_client = self._get_s3_client()
+            if s3_client is None:
+                s3_client = self._get_s3_client()
             response = s3_client.get_object(Bucket=self.s3_bucket, Key=s3_key)
-            content = response['Body'].read().decode('utf-8')
-            return json.loads(content)
+            # orjson parses the raw bytes directly, without decoding to str first
+            return orjson.loads(response['Body'].read())
         
         except ClientError as e:
             logger.error(f"Error reading S3 file {s3_key}: {e}")
             return None
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Error parsing JSON from {s3_key}: {e}")
             return None
     
-    def extract_work_items_from_json(
+    def _list_json_files_in_folders(self, folders: List[str]):
+        """
+        List the JSON files of several folders concurrently
+        Args:
+            folders: Folder names (ingestion dates)
+        Returns:
+            Iterator of (folder, files as returned by list_json_files_in_folder) in the order of folders
+        """
+        if not folders:
+            return
+        
+        executor = ThreadPoolExecutor(
+            max_workers=min(S3_LIST_MAX_WORKERS, len(folders)),
+            thread_name_prefix="s3-list"
+        )
+        try:
+            # Later folders must still be processed after earlier ones (later upserts win)
+            yield from zip(folders, executor.map(self.list_json_files_in_folder, folders))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _get_ingested_files(self, folder_name: str) -> Set[Tuple[str, datetime]]:
+        """
+        Get the files of a folder that already have work items in the database
+        Args:
+            folder_name: The folder name (ingestion date)
+        Returns:
+            Set of (json_filename, delivery_date) pairs; delivery dates are timezone-aware
+            so they compare equal to S3's LastModified
+        """
+        session = self.SessionLocal()
+        try:
+            rows = session.execute(
+                select(
+                    WorkItem.json_filename,
+                    cast(WorkItem.delivery_date, TIMESTAMP(timezone=True))
+                ).where(WorkItem.ingestion_date == folder_name).distinct()
+            )
+            return {(json_filename, delivery_date) for json_filename, delivery_date in rows}
+        finally:
+            session.close()
+    
+    def _can_skip_ingested_files(self, session: Session) -> bool:
+        """
+        Whether files with work items in the database can be trusted to be fully ingested
+        A file's items may be written in several batches, so a run that failed or
+        ended with errors can leave a file partially written. Skipping is only safe
+        once a full run has completed without errors after the last such run.
+        Args:
+            session: Open session
+        Returns:
+            True if already ingested files may be skipped
+        """
+        work_item_runs = (DataSyncLog.table_name == 'work_item',)
+        last_unsuccessful = session.execute(
+            select(func.max(DataSyncLog.id)).where(*work_item_runs, DataSyncLog.sync_status != 'completed')
+        ).scalar()
+        if last_unsuccessful is None:
+            return True
+        last_clean_full_run = session.execute(
+            select(func.max(DataSyncLog.id)).where(
+                *work_item_runs,
+                DataSyncLog.sync_status == 'completed',
+                DataSyncLog.sync_type == 'scheduled'
+            )
+        ).scalar()
+        return last_clean_full_run is not None and last_clean_full_run > last_unsuccessful
+    
+    def _fetch_json_files(self, json_files_info: List[Dict[str, Any]]):
+        """
+        Download and parse JSON files from S3 concurrently
+        Args:
+            json_files_info: Files as returned by list_json_files_in_folder
+        Returns:
+            Iterator of (json_key, delivery_date, parsed JSON or None, error message or None)
+            in the order of json_files_info
+        """
+        if not json_files_info:
+            return
+        
+        # One shared client for all worker threads
+        s3_client = self._get_s3_client()
+        
+        def fetch(json_file_info: Dict[str, Any]) -> Tuple[str, datetime, Optional[Dict[str, Any]], Optional[str]]:
+            json_key = json_file_info['key']
+            try:
+                return json_key, json_file_info['last_modified'], self.read_json_from_s3(json_key, s3_client), None
+            except Exception as e:
+                # Report per file instead of aborting the whole ingestion
+                logger.error(f"Error reading S3 file {json_key}: {e}")
+                return json_key, json_file_info['last_modified'], None, f"Error processing {json_key}: {str(e)}"
+        
+        max_workers = min(self.settings.s3_max_workers, len(json_files_info))
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="s3-get")
+        try:
+            # Keep at most 2 * max_workers downloads in flight or buffered, so a slow
+            # consumer does not hold every parsed file in memory; results are
+            # yielded in submission order and the window is topped up as they are used
+            files = iter(json_files_info)
+            pending = deque(
+                executor.submit(fetch, json_file_info)
+                for json_file_info in islice(files, 2 * max_workers)
+            )
+            while pending:
+                result = pending.popleft().result()
+                for json_file_info in islice(files, 1):
+                    pending.append(executor.submit(fetch, json_file_info))
+                yield result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def iter_work_items_from_json(
         self, 
         json_data: Dict[str, Any], 
         ingestion_date: str,
         json_filename: str,
         delivery_date: datetime
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Extract work items from parsed JSON data
+        Extract work items from parsed JSON data, one at a time
         Args:
             json_data: Parsed JSON content
             ingestion_date: Folder name (date)
             json_filename: Name of the JSON file
             delivery_date: File upload date from S3
         Returns:
-            List of work item dictionaries ready for database insertion
+            Iterator of work item dictionaries ready for database insertion
         """
-        work_items = []
+        # Problems are counted per work item and reported once for the file
+        extracted_count = 0
+        missing_id_count = 0
+        missing_task_id_count = 0
+        failed_count = 0
+        first_error = None
         
         # Check if 'workitems' key exists
         if 'workitems' not in json_data:
             logger.warning(f"No 'workitems' key found in {json_filename}")
-            return work_items
+            return
         
         workitems_list = json_data['workitems']
         if not isinstance(workitems_list, list):
             logger.warning(f"'workitems' is not a list in {json_filename}")
-            return work_items
+            return
         
         for workitem in workitems_list:
             try:
                 work_item_id = workitem.get('workItemId')
                 if not work_item_id:
-                    logger.warning(f"Missing workItemId in {json_filename}")
+                    missing_id_count += 1
                     continue
                 
                 # Extract annotatorId from metadata
-                annotator_id = None
-                if 'metadata' in workitem and isinstance(workitem['metadata'], dict):
-                    annotator_id = workitem['metadata'].get('annotatorId')
+                metadata = workitem.get('metadata')
+                annotator_id = metadata.get('annotatorId') if type(metadata) is dict else None
                 
                 # Extract taskId from the UUID key (e.g., "2d777b79-8c8d-4ddd-9603-d5050a8b5a4c")
-                # Find the first key that looks like a UUID and contains task data
+                # The first list value whose first entry carries metadata.taskId holds the task data
                 task_id = None
-                for key, value in workitem.items():
-                    if isinstance(value, list) and len(value) > 0:
-                        # Check if this list contains task metadata
-                        if isinstance(value[0], dict) and 'metadata' in value[0]:
-                            task_metadata = value[0]['metadata']
-                            if isinstance(task_metadata, dict) and 'taskId' in task_metadata:
-                                task_id = task_metadata['taskId']
-                                break
+                for value in workitem.values():
+                    if type(value) is list and value and type(value[0]) is dict:
+                        task_metadata = value[0].get('metadata')
+                        if type(task_metadata) is dict and 'taskId' in task_metadata:
+                            task_id = task_metadata['taskId']
+                            break
                 
                 if not task_id:
-                    logger.warning(f"Could not extract taskId for workItemId {work_item_id} in {json_filename}")
+                    missing_task_id_count += 1
                     continue
                 
                 # Generate colab_link
-                colab_link = f"https://rlhf-v3.turing.com/prompt/{task_id}"
+                colab_link = f"{COLAB_LINK_PREFIX}{task_id}"
                 
                 work_item_data = {
                     'work_item_id': work_item_id,
@@ -232,44 +489,62 @@ class S3IngestionService:
                     'json_filename': json_filename,
                 }
                 
-                work_items.append(work_item_data)
-                
             except Exception as e:
-                logger.error(f"Error processing work item in {json_filename}: {e}")
+                failed_count += 1
+                if first_error is None:
+                    first_error = e
                 continue
+            
+            extracted_count += 1
+            yield work_item_data
         
-        logger.info(f"Extracted {len(work_items)} work items from {json_filename}")
-        return work_items
+        logger.info(f"Extracted {extracted_count} work items from {json_filename}")
+        if missing_id_count or missing_task_id_count:
+            logger.warning(
+                f"Skipped work items in {json_filename}: {missing_id_count} without workItemId, "
+                f"{missing_task_id_count} without taskId"
+            )
+        if failed_count:
+            logger.error(f"Error processing {failed_count} work items in {json_filename}, first error: {first_error}")
     
-    def insert_work_items(self, work_items: List[Dict[str, Any]]) -> int:
+    def insert_work_items(self, work_items: List[Dict[str, Any]], session: Optional[Session] = None) -> int:
         """
         Insert work items into PostgreSQL database using upsert
+        Rows are written in chunks of s3_ingest_batch_size, one statement and
+        commit per chunk, so large inputs stay under PostgreSQL's bind parameter limit
         Args:
             work_items: List of work item dictionaries
+            session: Optional open session to write in; it is left uncommitted
+                for the caller (and rolled back on failure)
         Returns:
             Number of records inserted/updated
         """
         if not work_items:
             return 0
         
-        session = self.SessionLocal()
+        # Decided on the input size, so a full ingestion buffer is COPYed even
+        # when it holds work items repeated across files
+        use_copy = len(work_items) >= COPY_UPSERT_THRESHOLD
+        
+        # ON CONFLICT cannot update the same row twice in one statement, so keep
+        # only one row per work_item_id: the one with the latest delivery_date
+        # (the stable sort lets later files win ties)
+        work_items = sorted(work_items, key=itemgetter('delivery_date'))
+        work_items = list({work_item['work_item_id']: work_item for work_item in work_items}.values())
+        batch_size = self.settings.s3_ingest_batch_size
+        
+        if use_copy:
+            return self.bulk_upsert_work_items(work_items, session)
+        
+        owns_session = session is None
+        if owns_session:
+            session = self.SessionLocal()
         try:
-            # Use PostgreSQL's INSERT ... ON CONFLICT for upsert
-            stmt = insert(WorkItem).values(work_items)
-            stmt = stmt.on_conflict_do_update(
-                index_elements=['work_item_id'],
-                set_={
-                    'task_id': stmt.excluded.task_id,
-                    'annotator_id': stmt.excluded.annotator_id,
-                    'colab_link': stmt.excluded.colab_link,
-                    'ingestion_date': stmt.excluded.ingestion_date,
-                    'delivery_date': stmt.excluded.delivery_date,
-                    'json_filename': stmt.excluded.json_filename,
-                }
-            )
-            
-            session.execute(stmt)
-            session.commit()
+            for start in range(0, len(work_items), batch_size):
+                # Use PostgreSQL's INSERT ... ON CONFLICT for upsert
+                session.execute(_WORK_ITEM_UPSERT, work_items[start:start + batch_size])
+                if owns_session:
+                    session.commit()
             
             logger.info(f"Successfully upserted {len(work_items)} work items")
             return len(work_items)
@@ -279,7 +554,80 @@ class S3IngestionService:
             logger.error(f"Error inserting work items: {e}")
             raise
         finally:
-            session.close()
+            if owns_session:
+                session.close()
+    
+    def bulk_upsert_work_items(self, work_items: List[Dict[str, Any]], session: Optional[Session] = None) -> int:
+        """
+        Upsert work items by COPYing them into a temporary staging table and
+        running a single INSERT ... SELECT ... ON CONFLICT from it
+        Args:
+            work_items: List of work item dictionaries with unique work_item_ids
+            session: Optional open session to write in; it is left uncommitted
+                for the caller (and rolled back on failure)
+        Returns:
+            Number of records inserted/updated
+        """
+        if not work_items:
+            return 0
+        
+        buffer = io.StringIO()
+        for work_item in work_items:
+            buffer.write('\t'.join(_copy_text_value(work_item.get(column)) for column in _COPY_COLUMNS))
+            buffer.write('\n')
+        buffer.seek(0)
+        
+        owns_session = session is None
+        if owns_session:
+            session = self.SessionLocal()
+        try:
+            session.execute(_CREATE_WORK_ITEM_STAGE)
+            cursor = session.connection().connection.cursor()
+            try:
+                cursor.copy_expert(_COPY_WORK_ITEM_STAGE, buffer)
+            finally:
+                cursor.close()
+            session.execute(_UPSERT_FROM_WORK_ITEM_STAGE, {
+                'created_at': datetime.utcnow(),
+                'turing_status': 'Delivered',
+                'client_status': 'Pending',
+            })
+            # Drop now rather than at commit, in case the caller's transaction stages again
+            session.execute(_DROP_WORK_ITEM_STAGE)
+            if owns_session:
+                session.commit()
+            
+            logger.info(f"Successfully upserted {len(work_items)} work items via COPY")
+            return len(work_items)
+        
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Error bulk upserting work items: {e}")
+            raise
+        finally:
+            if owns_session:
+                session.close()
+    
+    def _flush_work_items(
+        self,
+        work_items: List[Dict[str, Any]],
+        errors: List[str],
+        session: Optional[Session] = None
+    ) -> int:
+        """
+        Upsert buffered work items, recording a failure in errors instead of raising
+        Args:
+            work_items: Buffered work item dictionaries
+            errors: Error list of the running ingestion
+            session: Optional open session to write in, left uncommitted
+        Returns:
+            Number of records inserted/updated
+        """
+        try:
+            return self.insert_work_items(work_items, session)
+        except Exception as e:
+            errors.append(f"Error inserting batch of {len(work_items)} work items: {str(e)}")
+            return 0
     
     def ingest_from_s3(self, specific_folder: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -294,9 +642,21 @@ class S3IngestionService:
         total_work_items = 0
         errors = []
         
+        # Work items are buffered across files and upserted in batches; a full
+        # buffer is large enough for insert_work_items to load it with COPY
+        pending_work_items = []
+        batch_size = max(self.settings.s3_ingest_batch_size, COPY_UPSERT_THRESHOLD)
+        
         session = self.SessionLocal()
         
         try:
+            # After an unsuccessful run some files may be only partially written, so
+            # everything is downloaded again until a full run completes cleanly.
+            # Checked before this run is logged, and the commit below ends the read
+            skip_ingested_files = self._can_skip_ingested_files(session)
+            if not skip_ingested_files:
+                logger.info("A previous ingestion did not complete cleanly, re-ingesting all files")
+            
             # Log sync start
             sync_log = DataSyncLog(
                 table_name='work_item',
@@ -323,35 +683,40 @@ class S3IngestionService:
                     'errors': ['No folders found']
                 }
             
-            # Process each folder
-            for folder in folders:
+            # Process each folder; the JSON files of the following folders are listed meanwhile
+            for folder, json_files_info in self._list_json_files_in_folders(folders):
                 logger.info(f"Processing folder: {folder}")
                 
-                # Get all JSON files in the folder with metadata
-                json_files_info = self.list_json_files_in_folder(folder)
+                # Files whose upload is already ingested are not downloaded again
+                ingested_files = self._get_ingested_files(folder) if skip_ingested_files else set()
+                if ingested_files:
+                    new_files_info = [
+                        json_file_info for json_file_info in json_files_info
+                        if (json_file_info['key'].split('/')[-1], json_file_info['last_modified']) not in ingested_files
+                    ]
+                    logger.info(f"Skipping {len(json_files_info) - len(new_files_info)} already ingested files in folder {folder}")
+                    json_files_info = new_files_info
                 
-                for json_file_info in json_files_info:
+                # Downloads run in worker threads; parsing and inserts stay on this thread
+                for json_key, delivery_date, json_data, read_error in self._fetch_json_files(json_files_info):
                     try:
-                        # Extract key and last_modified date
-                        json_key = json_file_info['key']
-                        delivery_date = json_file_info['last_modified']
-                        
                         # Extract filename
                         filename = json_key.split('/')[-1]
                         
-                        # Read JSON from S3
-                        json_data = self.read_json_from_s3(json_key)
+                        if read_error:
+                            errors.append(read_error)
+                            continue
                         if not json_data:
                             errors.append(f"Could not read {json_key}")
                             continue
                         
-                        # Extract work items with delivery_date
-                        work_items = self.extract_work_items_from_json(json_data, folder, filename, delivery_date)
-                        
-                        # Insert into database
-                        if work_items:
-                            inserted_count = self.insert_work_items(work_items)
-                            total_work_items += inserted_count
+                        # Extract work items with delivery_date and queue them for the
+                        # next batched insert; large files are flushed as they stream
+                        for work_item in self.iter_work_items_from_json(json_data, folder, filename, delivery_date):
+                            pending_work_items.append(work_item)
+                            if len(pending_work_items) >= batch_size:
+                                total_work_items += self._flush_work_items(pending_work_items, errors)
+                                pending_work_items = []
                         
                         total_files_processed += 1
                         
@@ -360,23 +725,36 @@ class S3IngestionService:
                         logger.error(error_msg)
                         errors.append(error_msg)
             
+            # Write the remaining buffered work items in the same transaction as
+            # the is_delivered update, which commits both
+            final_work_items = 0
+            if pending_work_items:
+                final_work_items = self._flush_work_items(pending_work_items, errors, session)
+            
             # Update is_delivered status in Task table based on newly synced work_items
             try:
                 from app.services.data_sync_service import get_data_sync_service
                 data_sync_service = get_data_sync_service()
-                data_sync_service._update_is_delivered_status()
+                data_sync_service._update_is_delivered_status(session)
+                total_work_items += final_work_items
             except Exception as e:
+                session.rollback()
                 logger.error(f"Error updating is_delivered status: {e}")
                 errors.append(f"Failed to update is_delivered status: {str(e)}")
+                # The rollback discarded the last batch as well, so write it on its own
+                if final_work_items:
+                    total_work_items += self._flush_work_items(pending_work_items, errors)
             
             # Update sync log
             end_time = datetime.now()
-            sync_log = session.query(DataSyncLog).filter_by(id=sync_log_id).first()
-            sync_log.sync_completed_at = end_time
-            sync_log.records_synced = total_work_items
-            sync_log.sync_status = 'completed' if not errors else 'completed_with_errors'
-            if errors:
-                sync_log.error_message = '; '.join(errors[:10])  # Store first 10 errors
+            session.execute(
+                update(DataSyncLog).where(DataSyncLog.id == sync_log_id).values(
+                    sync_completed_at=end_time,
+                    records_synced=total_work_items,
+                    sync_status='completed' if not errors else 'completed_with_errors',
+                    error_message='; '.join(errors[:10]) if errors else None  # Store first 10 errors
+                )
+            )
             session.commit()
             
             result = {
@@ -392,12 +770,15 @@ class S3IngestionService:
         
         except Exception as e:
             # Log failure
-            sync_log = session.query(DataSyncLog).filter_by(id=sync_log_id).first()
-            if sync_log:
-                sync_log.sync_status = 'failed'
-                sync_log.error_message = str(e)
-                sync_log.sync_completed_at = datetime.now()
-                session.commit()
+            session.rollback()
+            session.execute(
+                update(DataSyncLog).where(DataSyncLog.id == sync_log_id).values(
+                    sync_status='failed',
+                    error_message=str(e),
+                    sync_completed_at=datetime.now()
+                )
+            )
+            session.commit()
             
             logger.error(f"Fatal error during ingestion: {e}")
             raise